@@ -13,23 +13,36 @@ Features covered:
 - Reference population
 
 Run with:
-  uv add fastapi uvicorn
+  uv add fastapi "uvicorn[standard]"
   uv run uvicorn example_fastapi:app --reload
 
+uvicorn[standard] pulls in uvloop and httptools, which uvicorn then uses
+automatically in place of the stock asyncio loop and HTTP parser.
+
 Then visit: http://localhost:8000/docs
 """
 
+import asyncio
+import base64
+import binascii
+import dataclasses
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Annotated, Optional
 
 from bson import ObjectId
-from fastapi import Body, FastAPI, HTTPException, Path, Query, Request
+from bson.errors import InvalidId
+from fastapi import Body, Depends, FastAPI, HTTPException, Path, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
+from pydantic_core import to_json
+from pymongo import ReturnDocument
 
-from pygoose import Document, Ref, connect, disconnect
-from pygoose.plugins import TimestampsMixin
+from pygoose import CursorPage, Document, QuerySet, Ref, connect, disconnect
+from pygoose.integrations.fastapi import register_exception_handlers
 from pygoose.utils.exceptions import DocumentNotFound
+from pygoose.plugins import TimestampsMixin
 
 
 # ============================================================================
@@ -46,6 +59,9 @@ class Author(TimestampsMixin, Document):
 
     class Settings:
         collection = "authors"
+        indexes = [
+            {"fields": [("email", 1)]},
+        ]
 
 
 class BlogPost(TimestampsMixin, Document):
@@ -60,6 +76,43 @@ class BlogPost(TimestampsMixin, Document):
 
     class Settings:
         collection = "blog_posts"
+        # Each filter used by the list endpoints is paired with _id, so cursor
+        # pagination is a single index range scan instead of a collection scan.
+        indexes = [
+            {"fields": [("published", 1), ("_id", -1)]},
+            {"fields": [("author", 1), ("_id", -1)]},
+            {"fields": [("tags", 1), ("_id", -1)]},
+        ]
+
+    @classmethod
+    async def get_with_author(cls, post_id: ObjectId) -> "BlogPost":
+        """Load a post with its author populated in a single round trip.
+
+        Equivalent to get() followed by populate("author"), but the author is
+        joined server-side with $lookup. Raises DocumentNotFound if missing.
+        """
+        pipeline = [
+            {"$match": {"_id": post_id}},
+            {"$limit": 1},
+            {"$lookup": {
+                "from": Author._collection_name,
+                "localField": "author",
+                "foreignField": "_id",
+                "as": "_author",
+            }},
+        ]
+        cursor = await cls.get_collection().aggregate(pipeline)
+        raw = await cursor.to_list(length=1)
+        if not raw:
+            raise DocumentNotFound(f"{cls.__name__} with id '{post_id}' not found")
+
+        data = raw[0]
+        joined = data.pop("_author")
+        post = cls._from_mongo(data)
+        if joined:
+            # Same assignment PopulateEngine uses, so the ref isn't marked dirty
+            object.__setattr__(post, "author", Author._from_mongo(joined[0]))
+        return post
 
 
 # ============================================================================
@@ -68,7 +121,8 @@ class BlogPost(TimestampsMixin, Document):
 
 # Note: Pygoose's PyObjectId already handles JSON serialization automatically,
 # converting ObjectId -> string in JSON mode and preserving ObjectId in Python mode.
-# You can use model_dump(mode="json") to get string IDs for API responses.
+# Response schemas are built straight from document attributes; FastAPI then
+# encodes the declared response_model with pydantic-core in a single pass.
 
 
 # Author Schemas
@@ -101,14 +155,18 @@ class AuthorResponse(BaseModel):
     updated_at: Optional[datetime] = None
 
     @classmethod
-    def from_document(cls, doc: Author) -> "AuthorResponse":
-        # Use Pygoose's built-in JSON serialization
-        data = doc.model_dump(mode="json")
-        return cls(
-            id=data["id"],  # PyObjectId already serialized to string
-            name=data["name"],
-            email=data["email"],
-            bio=data.get("bio"),
+    def from_document(
+        cls, doc: Author, author_id: Optional[str] = None
+    ) -> "AuthorResponse":
+        # Copy attributes directly; dumping the whole document to a JSON-mode
+        # dict first would serialize every field only to throw the dict away.
+        # The document was validated when loaded, so skip validating it again.
+        # Datetimes stay native and are encoded to ISO-8601 by pydantic-core.
+        return cls.model_construct(
+            id=str(doc.id) if author_id is None else author_id,
+            name=doc.name,
+            email=doc.email,
+            bio=doc.bio,
             created_at=doc.created_at,
             updated_at=doc.updated_at,
         )
@@ -141,12 +199,11 @@ class BlogPostUpdate(BaseModel):
     tags: Optional[list[str]] = Field(None, max_length=10)
 
 
-class BlogPostResponse(BaseModel):
-    """Response schema for blog post data."""
+class BlogPostListItem(BaseModel):
+    """Blog post as returned by list endpoints, without the content body."""
 
     id: str
     title: str
-    content: str
     author_id: str
     published: bool
     tags: list[str]
@@ -156,55 +213,88 @@ class BlogPostResponse(BaseModel):
     author: Optional[AuthorResponse] = None
 
     @classmethod
-    def from_document(cls, doc: BlogPost, populate_author: bool = False) -> "BlogPostResponse":
-        author_response = None
-        if populate_author and isinstance(doc.author, Author):
-            author_response = AuthorResponse.from_document(doc.author)
+    def from_document(
+        cls,
+        doc: BlogPost,
+        populate_author: bool = False,
+        author: Optional[Author] = None,
+        **extra,
+    ) -> "BlogPostListItem":
+        # A Ref holds the ObjectId until populated, then the Author itself
+        ref = doc.author
+        if isinstance(ref, ObjectId):
+            author_id = str(ref)
+        else:
+            author_id = str(ref.id)
+            # An already-loaded author can be passed in to avoid fetching it again
+            if author is None and populate_author:
+                author = ref
+        # The author id is stringified once and shared with the nested author
+        author_response = (
+            AuthorResponse.from_document(author, author_id=author_id) if author else None
+        )
 
-        return cls(
+        return cls.model_construct(
             id=str(doc.id),
             title=doc.title,
-            content=doc.content,
-            author_id=str(doc.author.id if isinstance(
-                doc.author, Author) else doc.author),
+            author_id=author_id,
             published=doc.published,
             tags=doc.tags,
             views=doc.views,
             created_at=doc.created_at,
             updated_at=doc.updated_at,
             author=author_response,
+            **extra,
         )
 
 
+class BlogPostResponse(BlogPostListItem):
+    """Response schema for a single blog post, including its content."""
+
+    content: str
+
+    @classmethod
+    def from_document(
+        cls,
+        doc: BlogPost,
+        populate_author: bool = False,
+        author: Optional[Author] = None,
+    ) -> "BlogPostResponse":
+        return super().from_document(doc, populate_author, author, content=doc.content)
+
+
 # Pagination Schemas
 class PaginatedResponse(BaseModel):
     """Generic paginated response."""
 
     items: list
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class AuthorListResponse(BaseModel):
     """Paginated author list response."""
 
     items: list[AuthorResponse]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class BlogPostListResponse(BaseModel):
     """Paginated blog post list response."""
 
-    items: list[BlogPostResponse]
-    total: int
+    items: list[BlogPostListItem]
+    total: Optional[int] = None
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 # Generic Response Schemas
@@ -215,6 +305,12 @@ class MessageResponse(BaseModel):
     details: Optional[dict] = None
 
 
+class BulkCreateResponse(BaseModel):
+    """Ids of documents created by a bulk endpoint, in request order."""
+
+    ids: list[str]
+
+
 class StatsResponse(BaseModel):
     """Statistics response."""
 
@@ -234,7 +330,16 @@ async def lifespan(app: FastAPI):
     """Manage MongoDB connection lifecycle."""
     # Startup
     print("🚀 Starting Pygoose Blog API...")
-    await connect("mongodb://localhost:27017/pygoose_api")
+    db = await connect(
+        "mongodb://localhost:27017/pygoose_api",
+        maxPoolSize=50,  # Upper bound on concurrent operations per worker
+        minPoolSize=10,  # Keep warm connections around between bursts
+        maxIdleTimeMS=30000,
+        waitQueueTimeoutMS=2000,  # Fail fast instead of queueing forever
+    )
+    # Open a connection now so the first request doesn't pay for the handshake
+    await db.command("ping")
+    await asyncio.gather(Author.ensure_indexes(), BlogPost.ensure_indexes())
     print("✅ Connected to MongoDB")
     yield
     # Shutdown
@@ -248,6 +353,9 @@ app = FastAPI(
     description="A production-ready blog API built with Pygoose and FastAPI",
     version="1.0.0",
     lifespan=lifespan,
+    # No default_response_class: with the default one, FastAPI serializes
+    # response_model routes straight to JSON bytes with pydantic-core.
+    # Response models already hold ids as strings.
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -258,16 +366,150 @@ app = FastAPI(
 # ============================================================================
 
 
-@app.exception_handler(DocumentNotFound)
-async def document_not_found_handler(request: Request, exc: DocumentNotFound):
-    """Handle DocumentNotFound exceptions by returning 404."""
-    raise HTTPException(status_code=404, detail=str(exc))
+# Endpoints don't catch lookup errors themselves: Document.get() raises
+# DocumentNotFound and these handlers map it to a response in one place.
+register_exception_handlers(app)  # DocumentNotFound -> 404, PygooseError -> 500
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError):
+async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
     """Handle validation errors by returning 422."""
-    raise HTTPException(status_code=422, detail=str(exc))
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
+
+
+# ============================================================================
+# 3.6. SHARED FILTERS
+# ============================================================================
+
+
+# Filters reused by several endpoints. Document.find() copies the filter it is
+# given, so these are never mutated by query building.
+PUBLISHED_FILTER = {"published": True}
+EMPTY_FILTER: dict = {}
+
+
+# ============================================================================
+# 3.7. PATH PARAMETER DEPENDENCIES
+# ============================================================================
+
+
+# Each id is parsed once per request, so handlers receive an ObjectId and
+# malformed ids are rejected with a 400 before any database work.
+# (ObjectId.is_valid() parses the string too, so checking first parses twice.)
+def parse_author_id(
+    author_id: Annotated[str, Path(description="Author's ObjectId")],
+) -> ObjectId:
+    try:
+        return ObjectId(author_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid author_id format") from None
+
+
+def parse_post_id(
+    post_id: Annotated[str, Path(description="Post's ObjectId")],
+) -> ObjectId:
+    try:
+        return ObjectId(post_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid post_id format") from None
+
+
+AuthorId = Annotated[ObjectId, Depends(parse_author_id)]
+PostId = Annotated[ObjectId, Depends(parse_post_id)]
+
+
+# ============================================================================
+# 3.8. PAGINATION HELPERS
+# ============================================================================
+
+
+# Keyset pagination: pass the previous page's next_cursor to continue after it.
+# Each page is an indexed range scan on _id, so deep pages cost the same as the
+# first one. skip is kept for backwards compatibility but MongoDB still has to
+# walk every skipped document; it can't be combined with a cursor.
+CursorParam = Annotated[
+    Optional[str],
+    Query(description="Opaque next_cursor from the previous page"),
+]
+SkipParam = Annotated[
+    int,
+    Query(ge=0, deprecated=True, description="Offset pagination; prefer cursor"),
+]
+# Counting every match is a second, full scan of the filtered set, so totals
+# are opt-in. Clients page with has_more / next_cursor instead.
+ExactCountParam = Annotated[
+    bool,
+    Query(description="Also return the exact total (slower on large collections)"),
+]
+
+
+def encode_cursor(last_id: str) -> str:
+    """Wrap a page's last _id into an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(bytes.fromhex(last_id)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Turn a cursor from encode_cursor back into an _id hex string, or 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError):
+        raw = b""
+    if len(raw) != 12:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return raw.hex()
+
+
+async def fetch_page(
+    qs: QuerySet, cursor: Optional[str], skip: int, limit: int
+) -> CursorPage:
+    """Fetch a page newest first by _id, after cursor if given, otherwise from skip.
+
+    Every list endpoint uses this order, which matches the (field, _id -1)
+    indexes declared on BlogPost.
+    """
+    if cursor is None:
+        page = await qs.skip(skip).cursor_paginate(size=limit, descending=True)
+    elif skip:
+        raise HTTPException(status_code=400, detail="cursor and skip can't be combined")
+    else:
+        page = await qs.cursor_paginate(
+            size=limit, after=decode_cursor(cursor), descending=True
+        )
+
+    if page.next_cursor is None:
+        return page
+    return dataclasses.replace(page, next_cursor=encode_cursor(page.next_cursor))
+
+
+async def optional_count(qs: QuerySet, exact_count: bool) -> Optional[int]:
+    """Count matches only when requested; awaitable alongside fetch_page."""
+    return await qs.count() if exact_count else None
+
+
+# ============================================================================
+# 3.9. CACHED COUNTS
+# ============================================================================
+
+
+# The published count needs a filtered scan, so it is cached briefly. Post
+# writes drop the cached value so /stats reflects them on the next call.
+PUBLISHED_COUNT_TTL = 30.0
+_published_count: tuple[float, int] | None = None
+
+
+async def count_published_posts() -> int:
+    """Return the number of published posts, cached for PUBLISHED_COUNT_TTL seconds."""
+    global _published_count
+    now = time.monotonic()
+    if _published_count is None or now - _published_count[0] > PUBLISHED_COUNT_TTL:
+        _published_count = (now, await BlogPost.find(PUBLISHED_FILTER).count())
+    return _published_count[1]
+
+
+def invalidate_published_count() -> None:
+    """Forget the cached published count after a post is written."""
+    global _published_count
+    _published_count = None
 
 
 # ============================================================================
@@ -292,6 +534,28 @@ async def create_author(data: AuthorCreate) -> AuthorResponse:
     return AuthorResponse.from_document(author)
 
 
+# Bulk endpoints write a whole batch with one insert_many round trip and a
+# single write acknowledgement. Prefer them for imports and seeding.
+BULK_LIMIT = 100
+
+
+@app.post(
+    "/authors/bulk",
+    response_model=BulkCreateResponse,
+    status_code=201,
+    tags=["Authors"],
+    summary="Create many authors at once",
+)
+async def create_authors_bulk(
+    data: Annotated[list[AuthorCreate], Body(min_length=1, max_length=BULK_LIMIT)],
+) -> BulkCreateResponse:
+    """Create up to BULK_LIMIT authors in a single database round trip."""
+    authors = await Author.insert_many(
+        [Author(name=a.name, email=a.email, bio=a.bio) for a in data]
+    )
+    return BulkCreateResponse(ids=[str(a.id) for a in authors])
+
+
 @app.get(
     "/authors/{author_id}",
     response_model=AuthorResponse,
@@ -299,13 +563,10 @@ async def create_author(data: AuthorCreate) -> AuthorResponse:
     summary="Get author by ID",
 )
 async def get_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")]
+    author_id: AuthorId
 ) -> AuthorResponse:
     """Retrieve a single author by their ID."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    author = await Author.get(ObjectId(author_id))  # Raises DocumentNotFound if not found
+    author = await Author.get(author_id)  # Raises DocumentNotFound if not found
     return AuthorResponse.from_document(author)
 
 
@@ -316,19 +577,25 @@ async def get_author(
     summary="List all authors",
 )
 async def list_authors(
-    skip: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
+    skip: SkipParam = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    exact_count: ExactCountParam = False,
 ) -> AuthorListResponse:
-    """List all authors with pagination."""
-    authors = await Author.find().skip(skip).limit(limit).all()
-    total = await Author.find().count()
+    """List all authors, newest first, with cursor pagination."""
+    qs = Author.find()
+    page, total = await asyncio.gather(
+        fetch_page(qs, cursor, skip, limit),
+        optional_count(qs, exact_count),
+    )
 
     return AuthorListResponse(
-        items=[AuthorResponse.from_document(a) for a in authors],
+        items=[AuthorResponse.from_document(a) for a in page.items],
         total=total,
         skip=skip,
         limit=limit,
-        has_more=(skip + limit) < total,
+        has_more=page.has_next,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -339,25 +606,28 @@ async def list_authors(
     summary="Update an author",
 )
 async def update_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")],
+    author_id: AuthorId,
     data: AuthorUpdate,
 ) -> AuthorResponse:
     """Update an existing author's information."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    author = await Author.get(ObjectId(author_id))  # Raises DocumentNotFound if not found
-
-    # Update only provided fields
-    if data.name is not None:
-        author.name = data.name
-    if data.email is not None:
-        author.email = data.email
-    if data.bio is not None:
-        author.bio = data.bio
-
-    await author.save()
-    return AuthorResponse.from_document(author)
+    # Only provided fields are changed; the request model already validated them
+    changes = data.model_dump(exclude_none=True)
+    if not changes:
+        author = await Author.get(author_id)  # Raises DocumentNotFound if not found
+        return AuthorResponse.from_document(author)
+
+    # Apply the $set and read back the updated document in one round trip,
+    # instead of get() + attribute assignment + save(). This bypasses save(),
+    # so the updated_at that TimestampsMixin would set is included here.
+    changes["updated_at"] = datetime.now(timezone.utc)
+    raw = await Author.get_collection().find_one_and_update(
+        {"_id": author_id},
+        {"$set": changes},
+        return_document=ReturnDocument.AFTER,
+    )
+    if raw is None:
+        raise DocumentNotFound(f"Author with id '{author_id}' not found")
+    return AuthorResponse.from_document(Author._from_mongo(raw))
 
 
 @app.delete(
@@ -367,13 +637,10 @@ async def update_author(
     summary="Delete an author",
 )
 async def delete_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")]
+    author_id: AuthorId
 ) -> MessageResponse:
     """Delete an author by their ID."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    author = await Author.get(ObjectId(author_id))  # Raises DocumentNotFound if not found
+    author = await Author.get(author_id)  # Raises DocumentNotFound if not found
 
     # Check if author has posts
     post_count = await BlogPost.find({"author": author.id}).count()
@@ -401,10 +668,8 @@ async def delete_author(
 )
 async def create_post(data: BlogPostCreate) -> BlogPostResponse:
     """Create a new blog post."""
-    # Verify author exists
+    # Verify author exists (raises DocumentNotFound -> 404)
     author = await Author.get(ObjectId(data.author_id))
-    if not author:
-        raise HTTPException(status_code=404, detail="Author not found")
 
     # Create post with author reference (just pass the ObjectId)
     post = await BlogPost.create(
@@ -414,10 +679,68 @@ async def create_post(data: BlogPostCreate) -> BlogPostResponse:
         published=data.published,
         tags=data.tags,
     )
+    invalidate_published_count()
 
     return BlogPostResponse.from_document(post)
 
 
+@app.post(
+    "/posts/bulk",
+    response_model=BulkCreateResponse,
+    status_code=201,
+    tags=["Posts"],
+    summary="Create many blog posts at once",
+)
+async def create_posts_bulk(
+    data: Annotated[list[BlogPostCreate], Body(min_length=1, max_length=BULK_LIMIT)],
+) -> BulkCreateResponse:
+    """Create up to BULK_LIMIT posts in a single database round trip."""
+    # Check every referenced author with one query instead of one per post
+    author_ids = {ObjectId(p.author_id) for p in data}
+    found = await Author.find({"_id": {"$in": list(author_ids)}}).count()
+    if found != len(author_ids):
+        raise HTTPException(status_code=404, detail="Author not found")
+
+    posts = await BlogPost.insert_many([
+        BlogPost(
+            title=p.title,
+            content=p.content,
+            author=ObjectId(p.author_id),
+            published=p.published,
+            tags=p.tags,
+        )
+        for p in data
+    ])
+    invalidate_published_count()
+    return BulkCreateResponse(ids=[str(p.id) for p in posts])
+
+
+# Declared before /posts/{post_id} so "export" isn't parsed as a post id
+@app.get(
+    "/posts/export",
+    response_class=StreamingResponse,
+    tags=["Posts"],
+    summary="Export blog posts as NDJSON",
+)
+async def export_posts(
+    published_only: Annotated[bool, Query(
+        description="Export only published posts")] = False,
+) -> StreamingResponse:
+    """Stream every matching post as newline-delimited JSON.
+
+    Posts are encoded and sent as the cursor yields them, so memory use stays
+    flat however many posts match.
+    """
+    filter_dict = PUBLISHED_FILTER if published_only else EMPTY_FILTER
+    qs = BlogPost.find(filter_dict).sort("_id")
+
+    async def lines():
+        async for post in qs:
+            yield BlogPostResponse.from_document(post).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @app.get(
     "/posts/{post_id}",
     response_model=BlogPostResponse,
@@ -425,18 +748,16 @@ async def create_post(data: BlogPostCreate) -> BlogPostResponse:
     summary="Get blog post by ID",
 )
 async def get_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")],
+    post_id: PostId,
     populate: Annotated[bool, Query(
         description="Populate author details")] = True,
 ) -> BlogPostResponse:
     """Retrieve a single blog post by ID, optionally with author details."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))  # Raises DocumentNotFound if not found
-
+    # Both raise DocumentNotFound if not found
     if populate:
-        await post.populate("author")
+        post = await BlogPost.get_with_author(post_id)
+    else:
+        post = await BlogPost.get(post_id)
 
     return BlogPostResponse.from_document(post, populate_author=populate)
 
@@ -448,31 +769,38 @@ async def get_post(
     summary="List all blog posts",
 )
 async def list_posts(
-    skip: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
+    skip: SkipParam = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
     published_only: Annotated[bool, Query(
         description="Show only published posts")] = False,
     populate: Annotated[bool, Query(
         description="Populate author details")] = True,
+    exact_count: ExactCountParam = False,
 ) -> BlogPostListResponse:
-    """List all blog posts with pagination and optional filtering."""
-    filter_dict = {"published": True} if published_only else {}
+    """List blog posts, newest first, with cursor pagination and optional filtering."""
+    filter_dict = PUBLISHED_FILTER if published_only else EMPTY_FILTER
 
-    posts = await BlogPost.find(filter_dict).skip(skip).limit(limit).all()
-    total = await BlogPost.find(filter_dict).count()
+    # List views never render the body, so don't load it
+    qs = BlogPost.find(filter_dict).exclude("content")
+    if populate:
+        # Authors are joined into the page query with $lookup (one round trip)
+        qs = qs.populate("author")
 
-    # Populate authors if requested
-    if populate and posts:
-        for post in posts:
-            await post.populate("author")
+    page, total = await asyncio.gather(
+        fetch_page(qs, cursor, skip, limit),
+        optional_count(qs, exact_count),
+    )
+    posts = page.items
 
     return BlogPostListResponse(
-        items=[BlogPostResponse.from_document(
+        items=[BlogPostListItem.from_document(
             p, populate_author=populate) for p in posts],
         total=total,
         skip=skip,
         limit=limit,
-        has_more=(skip + limit) < total,
+        has_more=page.has_next,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -483,27 +811,28 @@ async def list_posts(
     summary="Update a blog post",
 )
 async def update_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")],
+    post_id: PostId,
     data: BlogPostUpdate,
 ) -> BlogPostResponse:
     """Update an existing blog post."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))  # Raises DocumentNotFound if not found
-
-    # Update only provided fields
-    if data.title is not None:
-        post.title = data.title
-    if data.content is not None:
-        post.content = data.content
-    if data.published is not None:
-        post.published = data.published
-    if data.tags is not None:
-        post.tags = data.tags
-
-    await post.save()
-    await post.populate("author")
+    # Raises DocumentNotFound if not found. The populated author is not
+    # written back: save() only sends the fields that changed.
+    post = await BlogPost.get_with_author(post_id)
+
+    # Only provided fields that actually differ are assigned. Assigning a
+    # field marks it dirty even if the value is unchanged, so an update that
+    # changes nothing would otherwise still cost a write.
+    changes = {
+        field: value
+        for field, value in data.model_dump(exclude_none=True).items()
+        if getattr(post, field) != value
+    }
+    if changes:
+        for field, value in changes.items():
+            setattr(post, field, value)
+        await post.save()
+        if "published" in changes:
+            invalidate_published_count()
 
     return BlogPostResponse.from_document(post, populate_author=True)
 
@@ -515,15 +844,13 @@ async def update_post(
     summary="Delete a blog post",
 )
 async def delete_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> MessageResponse:
     """Delete a blog post by ID."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))  # Raises DocumentNotFound if not found
+    post = await BlogPost.get(post_id)  # Raises DocumentNotFound if not found
 
     await post.delete()
+    invalidate_published_count()
     return MessageResponse(message="Post deleted successfully")
 
 
@@ -534,13 +861,10 @@ async def delete_post(
     summary="Publish a blog post",
 )
 async def publish_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> BlogPostResponse:
     """Publish a draft blog post."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))  # Raises DocumentNotFound if not found
+    post = await BlogPost.get_with_author(post_id)  # Raises DocumentNotFound if not found
 
     if post.published:
         raise HTTPException(
@@ -548,7 +872,7 @@ async def publish_post(
 
     post.published = True
     await post.save()
-    await post.populate("author")
+    invalidate_published_count()
 
     return BlogPostResponse.from_document(post, populate_author=True)
 
@@ -560,13 +884,10 @@ async def publish_post(
     summary="Increment post view count",
 )
 async def increment_view_count(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> MessageResponse:
     """Increment the view count for a blog post."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))  # Raises DocumentNotFound if not found
+    post = await BlogPost.get(post_id)  # Raises DocumentNotFound if not found
 
     post.views += 1
     await post.save()
@@ -589,35 +910,32 @@ async def increment_view_count(
     summary="Get posts by author",
 )
 async def get_posts_by_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")],
-    skip: Annotated[int, Query(ge=0)] = 0,
+    author_id: AuthorId,
+    cursor: CursorParam = None,
+    skip: SkipParam = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    exact_count: ExactCountParam = False,
 ) -> BlogPostListResponse:
-    """Get all blog posts by a specific author."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    author = await Author.get(ObjectId(author_id))  # Raises DocumentNotFound if not found
-
-    posts = (
-        await BlogPost.find({"author": author.id})
-        .skip(skip)
-        .limit(limit)
-        .all()
+    """Get blog posts by a specific author, newest first."""
+    # The posts query only needs the id from the path, so the author lookup
+    # runs concurrently with it. Author.get() still raises DocumentNotFound
+    # (404) for an unknown author.
+    qs = BlogPost.find({"author": author_id}).exclude("content")
+    author, page, total = await asyncio.gather(
+        Author.get(author_id),
+        fetch_page(qs, cursor, skip, limit),
+        optional_count(qs, exact_count),
     )
-    total = await BlogPost.find({"author": author.id}).count()
-
-    # Populate authors
-    for post in posts:
-        await post.populate("author")
+    posts = page.items
 
+    # Every post belongs to the author we already loaded
     return BlogPostListResponse(
-        items=[BlogPostResponse.from_document(
-            p, populate_author=True) for p in posts],
+        items=[BlogPostListItem.from_document(p, author=author) for p in posts],
         total=total,
         skip=skip,
         limit=limit,
-        has_more=(skip + limit) < total,
+        has_more=page.has_next,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -629,29 +947,30 @@ async def get_posts_by_author(
 )
 async def search_posts_by_tag(
     tag: Annotated[str, Path(description="Tag to search for")],
-    skip: Annotated[int, Query(ge=0)] = 0,
+    cursor: CursorParam = None,
+    skip: SkipParam = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    exact_count: ExactCountParam = False,
 ) -> BlogPostListResponse:
-    """Search blog posts by tag."""
-    posts = (
-        await BlogPost.find({"tags": tag})
-        .skip(skip)
-        .limit(limit)
-        .all()
+    """Search blog posts by tag, newest first.
+
+    Served by the multikey (tags, _id) index: each page is one range seek.
+    """
+    qs = BlogPost.find({"tags": tag}).exclude("content").populate("author")
+    page, total = await asyncio.gather(
+        fetch_page(qs, cursor, skip, limit),
+        optional_count(qs, exact_count),
     )
-    total = await BlogPost.find({"tags": tag}).count()
-
-    # Populate authors
-    for post in posts:
-        await post.populate("author")
+    posts = page.items
 
     return BlogPostListResponse(
-        items=[BlogPostResponse.from_document(
+        items=[BlogPostListItem.from_document(
             p, populate_author=True) for p in posts],
         total=total,
         skip=skip,
         limit=limit,
-        has_more=(skip + limit) < total,
+        has_more=page.has_next,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -667,16 +986,22 @@ async def search_posts_by_tag(
     summary="Get blog statistics",
 )
 async def get_statistics() -> StatsResponse:
-    """Get overall blog statistics."""
-    total_authors = await Author.find().count()
-    total_posts = await BlogPost.find().count()
-    published_posts = await BlogPost.find({"published": True}).count()
+    """Get overall blog statistics.
+
+    Collection totals come from collection metadata and may be approximate,
+    so the draft count is clamped at zero in case the two briefly disagree.
+    """
+    total_authors, total_posts, published_posts = await asyncio.gather(
+        Author.find().count(),
+        BlogPost.find().count(),
+        count_published_posts(),
+    )
 
     return StatsResponse(
         total_authors=total_authors,
         total_posts=total_posts,
         published_posts=published_posts,
-        draft_posts=total_posts - published_posts,
+        draft_posts=max(total_posts - published_posts, 0),
     )
 
 
@@ -685,18 +1010,44 @@ async def get_statistics() -> StatsResponse:
 # ============================================================================
 
 
+# These bodies never change, so they are encoded once at import time instead of
+# being rebuilt and serialized on every request (health probes hit these often).
+_HEALTH_BODY = MessageResponse(
+    message="healthy",
+    details={"service": "Pygoose Blog API", "version": "1.0.0"},
+).model_dump_json().encode()
+
+_ROOT_BODY = to_json({
+    "service": "Pygoose Blog API",
+    "version": "1.0.0",
+    "description": "Production-ready blog API built with Pygoose and FastAPI",
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc",
+    },
+    "endpoints": {
+        "authors": "/authors",
+        "posts": "/posts",
+        "export": "/posts/export",
+        "search": {
+            "by_author": "/authors/{author_id}/posts",
+            "by_tag": "/posts/search/by-tag/{tag}",
+        },
+        "stats": "/stats",
+        "health": "/health",
+    },
+})
+
+
 @app.get(
     "/health",
     response_model=MessageResponse,
     tags=["Health"],
     summary="Health check",
 )
-async def health_check() -> MessageResponse:
+async def health_check() -> Response:
     """Health check endpoint to verify API is running."""
-    return MessageResponse(
-        message="healthy",
-        details={"service": "Pygoose Blog API", "version": "1.0.0"},
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get(
@@ -704,27 +1055,9 @@ async def health_check() -> MessageResponse:
     tags=["Root"],
     summary="API information",
 )
-async def root() -> dict:
+async def root() -> Response:
     """Root endpoint with API information and available endpoints."""
-    return {
-        "service": "Pygoose Blog API",
-        "version": "1.0.0",
-        "description": "Production-ready blog API built with Pygoose and FastAPI",
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc",
-        },
-        "endpoints": {
-            "authors": "/authors",
-            "posts": "/posts",
-            "search": {
-                "by_author": "/authors/{author_id}/posts",
-                "by_tag": "/posts/search/by-tag/{tag}",
-            },
-            "stats": "/stats",
-            "health": "/health",
-        },
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # ============================================================================
@@ -734,8 +1067,8 @@ async def root() -> dict:
 """
 QUICK START:
 
-1. Install dependencies:
-   uv add fastapi uvicorn
+1. Install dependencies (the [standard] extra adds uvloop and httptools):
+   uv add fastapi "uvicorn[standard]"
 
 2. Start MongoDB:
    mongod
@@ -757,6 +1090,12 @@ QUICK START:
        "bio": "Tech writer and blogger"
      }'
 
+   # Create several authors in one request
+   curl -X POST "http://localhost:8000/authors/bulk" \
+     -H "Content-Type: application/json" \
+     -d '[{"name": "Bob", "email": "bob@example.com"},
+          {"name": "Carol", "email": "carol@example.com"}]'
+
    # Create a blog post (use the author ID from above)
    curl -X POST "http://localhost:8000/posts" \
      -H "Content-Type: application/json" \
@@ -780,6 +1119,12 @@ QUICK START:
    # Search by tag
    curl "http://localhost:8000/posts/search/by-tag/python"
 
+   # Export all published posts as NDJSON
+   curl "http://localhost:8000/posts/export?published_only=true"
+
+   # Fetch the next page using next_cursor from the previous response
+   curl "http://localhost:8000/posts?limit=10&cursor={next_cursor}"
+
    # Get statistics
    curl "http://localhost:8000/stats"
 
@@ -789,10 +1134,10 @@ KEY FEATURES DEMONSTRATED:
 ✅ OpenAPI schema generation with full validation
 ✅ ObjectId validation and error handling
 ✅ Reference population (Ref[Author])
-✅ Pagination with has_more flag
+✅ Cursor pagination with has_more / next_cursor
 ✅ Proper HTTP status codes (201 for creation, etc.)
 ✅ Type hints and documentation
-✅ Lifecycle management for MongoDB connection
+✅ Lifecycle management for MongoDB connection and indexes
 ✅ Search and filtering
 ✅ Statistics and health checks
 """
@@ -18,38 +18,90 @@ Run with:
   uv add fastapi uvicorn
   uv run uvicorn example_fastapi_full:app --reload
 
+With several workers, share the response cache through Redis:
+  uv add redis
+  REDIS_URL=redis://localhost:6379/0 uv run uvicorn example_fastapi_full:app --workers 4
+
 Then visit: http://localhost:8000/docs
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Annotated, Optional
+from types import MappingProxyType
+from typing import Annotated, Any, NoReturn, Optional
 
 from bson import ObjectId
-from fastapi import FastAPI, HTTPException, Path, Query, Request
+from bson.errors import InvalidId
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request, Response
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, field_validator
+from pydantic_core import to_json
+from pymongo import ReturnDocument
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional; without it responses are cached in-process
+    aioredis = None
+
+# redis.asyncio.Redis for the response cache, set in the lifespan when
+# REDIS_URL is configured (see 4.4)
+_redis: Any = None
 
 from pygoose import (
     Document,
     Ref,
     connect,
     disconnect,
+    get_client,
+    CursorPage,
     Encrypted,
     encryption,
     Indexed,
+    QuerySet,
     pre_save,
     post_save,
     set_audit_context,
 )
 from pygoose.plugins import TimestampsMixin, SoftDeleteMixin, AuditMixin
+from pygoose.integrations.fastapi import register_exception_handlers
 from pygoose.utils.exceptions import DocumentNotFound
 
 
+# ============================================================================
+# 0. LOGGING
+# ============================================================================
+
+
+# Handlers log through a queue; a background thread (started in the lifespan)
+# does the formatting and the write to stderr, so a slow terminal never
+# blocks the event loop.
+logger = logging.getLogger("pygoose.example")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler())
+
+
 # ============================================================================
 # 1. DOCUMENT MODELS - Full Feature Set
 # ============================================================================
 
 
+POST_STATUSES = frozenset({"draft", "published", "archived"})
+
+
 class Author(AuditMixin, TimestampsMixin, Document):
     """Blog author with audit logging and timestamps."""
 
@@ -74,7 +126,21 @@ class Author(AuditMixin, TimestampsMixin, Document):
     @post_save
     def log_author_saved(self):
         """Lifecycle hook: log when author is saved."""
-        print(f"✅ Author '{self.name}' saved with audit context")
+        logger.info("✅ Author '%s' saved with audit context", self.name)
+
+    @classmethod
+    async def stats(cls) -> dict:
+        """Count all and verified authors in one aggregation."""
+        pipeline = [
+            {"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "verified": {"$sum": {"$cond": ["$verified", 1, 0]}},
+            }},
+        ]
+        cursor = await cls.get_collection().aggregate(pipeline)
+        raw = await cursor.to_list(length=1)
+        return raw[0] if raw else {"total": 0, "verified": 0}
 
 
 class BlogPost(SoftDeleteMixin, AuditMixin, TimestampsMixin, Document):
@@ -109,7 +175,19 @@ class BlogPost(SoftDeleteMixin, AuditMixin, TimestampsMixin, Document):
         collection = "blog_posts"
         indexes = [
             {"fields": [("title", 1)]},
-            {"fields": [("status", 1)]},
+            # List filters are ordered by _id for paging. deleted_at sits
+            # between them so the implicit SoftDeleteMixin filter
+            # (deleted_at: None) is part of the index bounds, for pages and
+            # counts alike.
+            {"fields": [("status", 1), ("deleted_at", 1), ("_id", -1)]},
+            # multikey (one entry per tag)
+            {"fields": [("tags", 1), ("deleted_at", 1), ("_id", -1)]},
+            {"fields": [("author", 1), ("deleted_at", 1), ("_id", -1)]},
+            # Full-text search over title and content; title matches rank higher
+            {
+                "fields": [("title", "text"), ("content", "text")],
+                "weights": {"title": 10, "content": 5},
+            },
         ]
 
     @pre_save
@@ -124,10 +202,105 @@ class BlogPost(SoftDeleteMixin, AuditMixin, TimestampsMixin, Document):
     @pre_save
     def validate_status(self):
         """Lifecycle hook: validate status values."""
-        if self.status not in ["draft", "published", "archived"]:
+        if self.status not in POST_STATUSES:
             raise ValueError(
                 "Invalid status. Must be: draft, published, or archived")
 
+    @classmethod
+    async def publish(cls, post_id: ObjectId) -> Optional["BlogPost"]:
+        """Publish a live, unpublished post in one atomic update.
+
+        Returns the updated post, or None if no post matched (missing,
+        soft-deleted or already published). The published check is part of
+        the update filter, so two concurrent publishes can't both succeed.
+        Hooks don't run, but the change is still written to the audit log.
+        """
+        changes = {
+            "published": True,
+            "status": "published",
+            "updated_at": datetime.now(timezone.utc),
+        }
+        raw = await cls.get_collection().find_one_and_update(
+            {"_id": post_id, "published": {"$ne": True}, "deleted_at": None},
+            {"$set": changes},
+            return_document=ReturnDocument.AFTER,
+        )
+        if raw is None:
+            return None
+        post = cls._from_mongo(raw)
+        await post._log_audit("update", post.id, changes=changes)
+        return post
+
+    @classmethod
+    async def update_fields(
+        cls, post_id: ObjectId, changes: dict[str, Any]
+    ) -> Optional["BlogPost"]:
+        """Set the given fields on a live post in one atomic update.
+
+        Returns the updated post, or None if no live post matched. Like
+        publish(), hooks don't run (callers validate the values), but the
+        change is still written to the audit log.
+        """
+        changes = {**changes, "updated_at": datetime.now(timezone.utc)}
+        raw = await cls.get_collection().find_one_and_update(
+            {"_id": post_id, "deleted_at": None},
+            {"$set": changes},
+            return_document=ReturnDocument.AFTER,
+        )
+        if raw is None:
+            return None
+        post = cls._from_mongo(raw)
+        await post._log_audit("update", post.id, changes=changes)
+        return post
+
+    @classmethod
+    async def increment_views(cls, post_id: ObjectId) -> int:
+        """Atomically add one view to a live post and return the new count.
+
+        A counter bump doesn't need the full read-modify-write of save(), so
+        hooks and audit logging are skipped and only the view count is sent
+        back. Soft-deleted posts don't match and raise DocumentNotFound.
+        """
+        raw = await cls.get_collection().find_one_and_update(
+            {"_id": post_id, "deleted_at": None},
+            {"$inc": {"views": 1}, "$currentDate": {"updated_at": True}},
+            projection={"views": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if raw is None:
+            raise DocumentNotFound(f"{cls.__name__} with id '{post_id}' not found")
+        return raw["views"]
+
+    @classmethod
+    async def stats(cls) -> dict:
+        """Compute every post metric in a single pass over the collection.
+
+        Soft-deleted posts are counted separately and left out of the
+        other metrics, matching what find() returns.
+        """
+        deleted = {"$ne": [{"$ifNull": ["$deleted_at", None]}, None]}
+
+        def live(condition) -> dict:
+            return {"$sum": {"$cond": [{"$and": [{"$not": [deleted]}, condition]}, 1, 0]}}
+
+        pipeline = [
+            {"$group": {
+                "_id": None,
+                "total": live(True),
+                "published": live({"$eq": ["$published", True]}),
+                "draft": live({"$eq": ["$status", "draft"]}),
+                "archived": live({"$eq": ["$status", "archived"]}),
+                "deleted": {"$sum": {"$cond": [deleted, 1, 0]}},
+                "views": {"$sum": {"$cond": [deleted, 0, "$views"]}},
+            }},
+        ]
+        cursor = await cls.get_collection().aggregate(pipeline)
+        raw = await cursor.to_list(length=1)
+        if not raw:
+            return dict.fromkeys(
+                ["total", "published", "draft", "archived", "deleted", "views"], 0)
+        return raw[0]
+
 
 # ============================================================================
 # 2. PYDANTIC SCHEMAS
@@ -176,6 +349,19 @@ class AuthorResponse(BaseModel):
             updated_at=doc.updated_at,
         )
 
+    @classmethod
+    def from_document_fast(cls, doc: Author) -> "AuthorResponse":
+        """Build without validation; only for documents loaded from MongoDB."""
+        return cls.model_construct(
+            id=str(doc.id),
+            name=doc.name,
+            email=doc.email,  # Decrypted on load
+            bio=doc.bio,
+            verified=doc.verified,
+            created_at=doc.created_at,
+            updated_at=doc.updated_at,
+        )
+
 
 class BlogPostCreate(BaseModel):
     """Request schema for creating a blog post."""
@@ -198,7 +384,7 @@ class BlogPostCreate(BaseModel):
     @field_validator("status")
     @classmethod
     def validate_status(cls, v: str) -> str:
-        if v not in ["draft", "published", "archived"]:
+        if v not in POST_STATUSES:
             raise ValueError("Status must be: draft, published, or archived")
         return v
 
@@ -213,6 +399,13 @@ class BlogPostUpdate(BaseModel):
     status: Optional[str] = None
     summary: Optional[str] = None
 
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in POST_STATUSES:
+            raise ValueError("Status must be: draft, published, or archived")
+        return v
+
 
 class BlogPostResponse(BaseModel):
     """Response schema for blog post data."""
@@ -257,6 +450,79 @@ class BlogPostResponse(BaseModel):
         )
 
 
+class BlogPostListItem(BaseModel):
+    """Blog post summary for list views (no content body)."""
+
+    id: str
+    title: str
+    author_id: str
+    published: bool
+    status: str
+    tags: list[str]
+    views: int
+    created_at: Optional[datetime] = None
+    author: Optional[AuthorResponse] = None
+
+    @classmethod
+    def from_document_fast(
+        cls, doc: BlogPost, author: Optional[AuthorResponse] = None
+    ) -> "BlogPostListItem":
+        """Build without validation; only for documents loaded from MongoDB.
+
+        List pages build up to 100 items per request, and the stored data
+        was validated when it was written. Includes the author when it was
+        populated, or the given author response when the caller already
+        has it.
+        """
+        ref = doc.author
+        populated = isinstance(ref, Author)
+        if populated and author is None:
+            author = AuthorResponse.from_document_fast(ref)
+        return cls.model_construct(
+            id=str(doc.id),
+            title=doc.title,
+            author_id=str(ref.id if populated else ref),
+            published=doc.published,
+            status=doc.status,
+            tags=doc.tags,
+            views=doc.views,
+            created_at=doc.created_at,
+            author=author,
+        )
+
+    @classmethod
+    def from_raw(
+        cls, raw: dict[str, Any], author: Optional[AuthorResponse] = None
+    ) -> "BlogPostListItem":
+        """Build straight from a raw LIST_FIELDS dict, with no BlogPost at all.
+
+        Used for unpopulated lists, where building a document first would
+        only be thrown away.
+        """
+        return cls.model_construct(
+            id=str(raw["_id"]),
+            title=raw["title"],
+            author_id=str(raw["author"]),
+            published=raw.get("published", False),
+            status=raw.get("status", "draft"),
+            tags=raw.get("tags", []),
+            views=raw.get("views", 0),
+            created_at=raw.get("created_at"),
+            author=author,
+        )
+
+
+# Fields loaded for list queries: exactly what BlogPostListItem renders, so
+# content, summary and the soft-delete/update timestamps stay on the server
+LIST_FIELDS = (
+    "title", "author", "published", "status", "tags", "views", "created_at",
+)
+
+# Fixed filters shared by every request; read-only since find() copies them
+NO_FILTER = MappingProxyType({})
+VERIFIED_AUTHORS_FILTER = MappingProxyType({"verified": True})
+
+
 class PaginatedResponse(BaseModel):
     """Generic paginated response."""
 
@@ -271,20 +537,24 @@ class AuthorListResponse(BaseModel):
     """Paginated author list response."""
 
     items: list[AuthorResponse]
-    total: int
+    total: Optional[int]  # None when not counted (?with_total=false)
     skip: int
     limit: int
     has_more: bool
+    count_skipped: bool = False  # total inferred from a short first page
+    next_cursor: Optional[str] = None  # pass as ?after= for the next page
 
 
 class BlogPostListResponse(BaseModel):
     """Paginated blog post list response."""
 
-    items: list[BlogPostResponse]
-    total: int
+    items: list[BlogPostListItem]
+    total: Optional[int]  # None when not counted (?with_total=false)
     skip: int
     limit: int
     has_more: bool
+    count_skipped: bool = False  # total inferred from a short first page
+    next_cursor: Optional[str] = None  # pass as ?after= for the next page
 
 
 class MessageResponse(BaseModel):
@@ -315,7 +585,8 @@ class StatsResponse(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage MongoDB connection and encryption lifecycle."""
-    print("🚀 Starting Pygoose Blog API...")
+    _log_listener.start()
+    logger.info("🚀 Starting Pygoose Blog API...")
 
     # Initialize encryption with FIXED key for development
     # IMPORTANT: In production, use environment variables!
@@ -323,17 +594,49 @@ async def lifespan(app: FastAPI):
     dev_key = "L9Zj3yKvN8Qw5tRp2sXm6fBnHgDcVaUe4iOlMkPj7zA="  # Fixed key for dev
     encryption.set_key(dev_key)
 
-    # Connect to MongoDB
-    await connect("mongodb://localhost:27017/pygoose_api")
-    print("✅ Connected to MongoDB")
-    print("🔐 Encryption initialized (using fixed dev key)")
-    print("⚠️  WARNING: Using fixed key for development. Use env vars in production!")
+    # Connect to MongoDB. Wire compression helps text-heavy posts when the
+    # database is across a network; zstd needs the optional `zstandard`
+    # package, zlib is always available.
+    compressors = ["zlib"]
+    if importlib.util.find_spec("zstandard") is not None:
+        compressors.insert(0, "zstd")
+    db = await connect(
+        "mongodb://localhost:27017/pygoose_api",
+        maxPoolSize=200,  # Upper bound on concurrent operations per worker
+        minPoolSize=20,  # Keep warm connections around between bursts
+        maxIdleTimeMS=30000,
+        compressors=compressors,
+        retryWrites=True,
+    )
+    # Open a connection now so the first request doesn't pay for the handshake
+    await db.command("ping")
+    pool = get_client().options.pool_options
+    logger.info(
+        "✅ Connected to MongoDB (pool %d-%d, compressors %s)",
+        pool.min_pool_size, pool.max_pool_size, ",".join(compressors),
+    )
+
+    await asyncio.gather(Author.ensure_indexes(), BlogPost.ensure_indexes())
+    logger.info("📇 Indexes ensured")
+    logger.info("🔐 Encryption initialized (using fixed dev key)")
+    logger.warning("⚠️  WARNING: Using fixed key for development. Use env vars in production!")
+
+    # Share the response cache between workers when Redis is configured
+    global _redis
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url and aioredis is not None:
+        _redis = aioredis.from_url(redis_url)
+        logger.info("🧊 Response cache stored in Redis")
 
     yield
 
-    print("🛑 Shutting down...")
+    logger.info("🛑 Shutting down...")
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
     await disconnect()
-    print("✅ Disconnected from MongoDB")
+    logger.info("✅ Disconnected from MongoDB")
+    _log_listener.stop()
 
 
 app = FastAPI(
@@ -351,16 +654,15 @@ app = FastAPI(
 # ============================================================================
 
 
-@app.exception_handler(DocumentNotFound)
-async def document_not_found_handler(request: Request, exc: DocumentNotFound):
-    """Handle DocumentNotFound exceptions by returning 404."""
-    raise HTTPException(status_code=404, detail=str(exc))
+# Endpoints don't catch lookup errors themselves: Document.get() raises
+# DocumentNotFound and these handlers map it to a response in one place.
+register_exception_handlers(app)  # DocumentNotFound -> 404, PygooseError -> 500
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError):
+async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
     """Handle validation errors by returning 422."""
-    raise HTTPException(status_code=422, detail=str(exc))
+    return JSONResponse(status_code=422, content={"detail": str(exc)})
 
 
 # ============================================================================
@@ -379,14 +681,343 @@ async def set_audit_context_middleware(request: Request, call_next):
     set_audit_context(user_id=user_id, ip_address=ip_address)
 
     try:
-        response = await call_next(request)
-        return response
+        return await call_next(request)
     finally:
         # Clear audit context after request
         from pygoose import clear_audit_context
         clear_audit_context()
 
 
+# ============================================================================
+# 4.3. PATH PARAMETERS
+# ============================================================================
+
+
+# Parse path ids once; a malformed id is a 400 before the handler runs.
+def parse_author_id(
+    author_id: Annotated[str, Path(description="Author's ObjectId")],
+) -> ObjectId:
+    try:
+        return ObjectId(author_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid author_id format") from None
+
+
+def parse_post_id(
+    post_id: Annotated[str, Path(description="Post's ObjectId")],
+) -> ObjectId:
+    try:
+        return ObjectId(post_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid post_id format") from None
+
+
+AuthorId = Annotated[ObjectId, Depends(parse_author_id)]
+PostId = Annotated[ObjectId, Depends(parse_post_id)]
+
+
+async def raise_post_missing(post_id: ObjectId) -> NoReturn:
+    """Raise the 404 for an id that matched no live post.
+
+    Only this error path pays for telling deleted posts apart from missing
+    ones, with an _id-only existence check.
+    """
+    if await BlogPost.find_deleted(post_id).exists():
+        raise HTTPException(status_code=404, detail="Post has been deleted")
+    raise DocumentNotFound(f"BlogPost with id '{post_id}' not found")
+
+
+async def load_live_post(post_id: ObjectId, populate: bool = False) -> BlogPost:
+    """Load a post that isn't soft-deleted, or raise a 404.
+
+    find() filters out deleted posts in the query itself, and a populated
+    author is joined in the same round trip.
+    """
+    query = BlogPost.find(post_id)
+    if populate:
+        query = query.populate("author")
+    post = await query.first()
+    if post is None:
+        await raise_post_missing(post_id)
+    return post
+
+
+# ============================================================================
+# 4.4. RESPONSE CACHE
+# ============================================================================
+
+
+# Hot GET endpoints keep their responses for a few seconds. Each write
+# handler drops the entries it can have changed (invalidate_cache), so a
+# client never reads its own write stale. Entries are grouped by the first
+# element of their key: "post" (one post), the post list and count groups in
+# POST_LIST_GROUPS, and "stats". A view bump only drops that post's entries;
+# lists and stats may show its view count up to their TTL late.
+#
+# By default entries live in this process, so with `uvicorn --workers N` each
+# worker caches (and invalidates) on its own. Set REDIS_URL (and install
+# `redis`) to keep them in Redis instead, shared by every worker.
+STATS_CACHE_TTL = 60.0
+POST_CACHE_TTL = 30.0
+POST_LIST_CACHE_TTL = 5.0
+# Filtered list totals change rarely between page clicks, and each one is a
+# count over every matching index entry, so they are kept longer than pages
+COUNT_CACHE_TTL = 30.0
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+REDIS_CACHE_PREFIX = "pygoose_blog:cache:"
+# Redis keeps a set of live keys per group, so invalidation needs no SCAN.
+# It outlives every entry it tracks.
+REDIS_GROUP_TTL = int(max(STATS_CACHE_TTL, POST_CACHE_TTL, COUNT_CACHE_TTL))
+
+# Cache groups holding post lists and their totals
+POST_LIST_GROUPS = ("posts", "posts_count", "author_posts_count", "tag_posts_count")
+
+_response_cache: dict[tuple, tuple[float, BaseModel]] = {}
+
+
+class CachedCount(BaseModel):
+    """A list total, wrapped so it can go through the response cache."""
+
+    total: int
+
+
+def _redis_key(key: tuple) -> str:
+    return REDIS_CACHE_PREFIX + ":".join(map(str, key))
+
+
+def _redis_group_key(group: str) -> str:
+    return REDIS_CACHE_PREFIX + "group:" + group
+
+
+async def cache_get(key: tuple, ttl: float, model: type[BaseModel]) -> Any | None:
+    """Return a cached response younger than ttl seconds, or None."""
+    if _redis is not None:
+        raw = await _redis.get(_redis_key(key))
+        return model.model_validate_json(raw) if raw is not None else None
+
+    entry = _response_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > ttl:
+        return None
+    return entry[1]
+
+
+async def cache_set(key: tuple, value: BaseModel, ttl: float) -> None:
+    """Cache a response for ttl seconds."""
+    if _redis is not None:
+        redis_key = _redis_key(key)
+        group_key = _redis_group_key(key[0])
+        async with _redis.pipeline(transaction=False) as pipe:
+            pipe.set(redis_key, value.model_dump_json(), ex=int(ttl))
+            pipe.sadd(group_key, redis_key)
+            pipe.expire(group_key, REDIS_GROUP_TTL)
+            await pipe.execute()
+        return
+
+    # Evict the oldest entry when full
+    if key not in _response_cache and len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (time.monotonic(), value)
+
+
+async def invalidate_cache(*groups: str, post_id: Optional[ObjectId] = None) -> None:
+    """Drop the cached responses a write may have changed.
+
+    Every entry in the given groups is dropped, and with post_id also that
+    post's own entries (both populate variants).
+    """
+    if _redis is not None:
+        keys = []
+        if groups:
+            group_keys = [_redis_group_key(group) for group in groups]
+            async with _redis.pipeline(transaction=False) as pipe:
+                for group_key in group_keys:
+                    pipe.smembers(group_key)
+                members = await pipe.execute()
+            keys = [key for group in members for key in group] + group_keys
+        if post_id is not None:
+            keys += [_redis_key(("post", post_id, populate)) for populate in (True, False)]
+        if keys:
+            await _redis.unlink(*keys)
+        return
+
+    for key in [
+        k for k in _response_cache
+        if k[0] in groups or (post_id is not None and k[:2] == ("post", post_id))
+    ]:
+        del _response_cache[key]
+
+
+async def invalidate_post_writes(post_id: Optional[ObjectId] = None) -> None:
+    """Drop what a post create/update/delete can change: lists, totals, stats."""
+    await invalidate_cache(*POST_LIST_GROUPS, "stats", post_id=post_id)
+
+
+async def cached_count(query: QuerySet, key: Optional[tuple]) -> int:
+    """Count query, reusing a total cached under key for COUNT_CACHE_TTL."""
+    if key is None:
+        return await query.count()
+    cached = await cache_get(key, COUNT_CACHE_TTL, CachedCount)
+    if cached is not None:
+        return cached.total
+    total = await query.count()
+    await cache_set(key, CachedCount(total=total), COUNT_CACHE_TTL)
+    return total
+
+
+# ============================================================================
+# 4.45. CONDITIONAL GET
+# ============================================================================
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison, as RFC 9110 requires for GET."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def etag_response(request: Request, model: BaseModel) -> Response:
+    """Serialize a response with an ETag, or send 304 if the client has it.
+
+    The tag hashes the JSON body, so it changes whenever anything in the
+    response does (including a populated author).
+    """
+    body = model.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+# ============================================================================
+# 4.5. PAGINATION HELPERS
+# ============================================================================
+
+
+# Pages are ordered newest first by _id. Pass a page's next_cursor as
+# ?after= to get the following page: that is an index range scan on _id, so
+# deep pages cost the same as the first one. skip still works, but MongoDB
+# has to walk every skipped document; the two can't be combined.
+AfterParam = Annotated[
+    Optional[str],
+    Query(description="next_cursor of the previous page"),
+]
+
+# has_more comes from fetching one extra document, so the total is only
+# needed for display. Clients that just page forward can skip the count
+# query, which is the part of a list request that grows with the collection.
+WithTotalParam = Annotated[
+    bool,
+    Query(description="Count the matching documents (total)"),
+]
+
+
+@dataclass
+class ListPage:
+    """One page of a list endpoint."""
+
+    items: list
+    total: Optional[int]
+    has_more: bool
+    count_skipped: bool
+    next_cursor: Optional[str]
+
+
+async def raw_cursor_page(
+    query: QuerySet, size: int, after: Optional[ObjectId]
+) -> CursorPage[dict[str, Any]]:
+    """cursor_paginate(descending=True), returning raw dicts via raw()."""
+    if after is not None:
+        query = query.filter({"_id": {"$lt": after}})
+    items = await query.sort("-_id").limit(size + 1).raw()
+    has_next = len(items) > size
+    items = items[:size]
+    return CursorPage(
+        items=items,
+        size=size,
+        next_cursor=str(items[-1]["_id"]) if has_next else None,
+        has_next=has_next,
+    )
+
+
+async def fetch_page(
+    page_query: QuerySet,
+    count_query: QuerySet,
+    skip: int,
+    limit: int,
+    after: Optional[str] = None,
+    count_key: Optional[tuple] = None,
+    with_total: bool = True,
+    raw: bool = False,
+) -> ListPage:
+    """Fetch a page of page_query (newest first) and the count_query total.
+
+    The count is skipped when the first page is also the last one, since
+    its length is then the total. Otherwise page and count run concurrently.
+    Pass count_key for filtered queries to reuse the total across pages.
+    Only a query with no filter at all (not even the implicit soft-delete
+    one) counts from collection metadata and needs no cache. With
+    with_total=False no count runs and total is None unless the short
+    first page gives it away. With raw=True the items are plain dicts
+    (page_query must not populate anything).
+    """
+    after_id = None
+    if after is not None:
+        if skip:
+            raise HTTPException(status_code=400, detail="after and skip can't be combined")
+        try:
+            after_id = ObjectId(after)
+        except InvalidId:
+            raise HTTPException(status_code=400, detail="Invalid after cursor")
+
+    if raw:
+        fetch = raw_cursor_page(page_query.skip(skip), limit, after_id)
+    else:
+        fetch = page_query.skip(skip).cursor_paginate(
+            size=limit, after=after_id, descending=True)
+
+    if skip == 0 and after is None:
+        page = await fetch
+        if not page.has_next:
+            return ListPage(page.items, len(page.items), False, True, None)
+        total = await cached_count(count_query, count_key) if with_total else None
+    elif not with_total:
+        page = await fetch
+        total = None
+    else:
+        page, total = await asyncio.gather(fetch, cached_count(count_query, count_key))
+
+    return ListPage(page.items, total, page.has_next, False, page.next_cursor)
+
+
+def post_list_response(
+    page: ListPage,
+    skip: int,
+    limit: int,
+    author: Optional[Author] = None,
+    raw: bool = False,
+) -> BlogPostListResponse:
+    """Build a post list response from a fetched page.
+
+    Pass author when every post on the page is known to be by them, and
+    raw=True for a page fetched with fetch_page(raw=True).
+    """
+    author_response = AuthorResponse.from_document_fast(author) if author else None
+    build = BlogPostListItem.from_raw if raw else BlogPostListItem.from_document_fast
+    return BlogPostListResponse(
+        items=[build(p, author_response) for p in page.items],
+        total=page.total,
+        skip=skip,
+        limit=limit,
+        has_more=page.has_more,
+        count_skipped=page.count_skipped,
+        next_cursor=page.next_cursor,
+    )
+
+
 # ============================================================================
 # 5. AUTHOR ENDPOINTS
 # ============================================================================
@@ -408,6 +1039,7 @@ async def create_author(data: AuthorCreate) -> AuthorResponse:
             bio=data.bio,
             verified=data.verified,
         )
+        await invalidate_cache("stats")
         return AuthorResponse.from_document(author)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
@@ -420,14 +1052,10 @@ async def create_author(data: AuthorCreate) -> AuthorResponse:
     summary="Get author by ID",
 )
 async def get_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")]
+    author_id: AuthorId
 ) -> AuthorResponse:
     """Retrieve a single author by their ID."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    # v0.3.0+: get() now accepts string ObjectId directly
-    author = await Author.get(author_id)  # No ObjectId() conversion needed!
+    author = await Author.get(author_id)
     return AuthorResponse.from_document(author)
 
 
@@ -440,21 +1068,28 @@ async def get_author(
 async def list_authors(
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    after: AfterParam = None,
     verified_only: Annotated[bool, Query(
         description="Show only verified authors")] = False,
+    with_total: WithTotalParam = True,
 ) -> AuthorListResponse:
     """List all authors with optional filtering."""
-    filter_dict = {"verified": True} if verified_only else {}
+    authors_query = Author.find(
+        VERIFIED_AUTHORS_FILTER if verified_only else NO_FILTER)
 
-    authors = await Author.find(filter_dict).skip(skip).limit(limit).all()
-    total = await Author.find(filter_dict).count()
+    # Without a filter, count() reads collection metadata instead of
+    # scanning, so total (and has_more) may be slightly approximate
+    page = await fetch_page(
+        authors_query, authors_query, skip, limit, after, with_total=with_total)
 
     return AuthorListResponse(
-        items=[AuthorResponse.from_document(a) for a in authors],
-        total=total,
+        items=[AuthorResponse.from_document_fast(a) for a in page.items],
+        total=page.total,
         skip=skip,
         limit=limit,
-        has_more=(skip + limit) < total,
+        has_more=page.has_more,
+        count_skipped=page.count_skipped,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -465,24 +1100,22 @@ async def list_authors(
     summary="Update an author",
 )
 async def update_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")],
+    author_id: AuthorId,
     data: AuthorUpdate,
 ) -> AuthorResponse:
     """Update an author with audit logging."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    # v0.3.0+: String shortcut
     author = await Author.get(author_id)
 
-    if data.name is not None:
-        author.name = data.name
-    if data.bio is not None:
-        author.bio = data.bio
-    if data.verified is not None:
-        author.verified = data.verified
+    # Only assign fields that actually change: save() then sends a $set with
+    # just those fields, and skips the write (and audit entry) if none do.
+    for field, value in data.model_dump(exclude_none=True).items():
+        if getattr(author, field) != value:
+            setattr(author, field, value)
 
-    await author.save()
+    if author.is_dirty:
+        await author.save()
+        # Populated posts embed the author; verified feeds the stats
+        await invalidate_cache("post", *POST_LIST_GROUPS, "stats")
     return AuthorResponse.from_document(author)
 
 
@@ -493,13 +1126,10 @@ async def update_author(
     summary="Delete an author",
 )
 async def delete_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")]
+    author_id: AuthorId
 ) -> MessageResponse:
     """Delete an author permanently."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    author = await Author.get(ObjectId(author_id))
+    author = await Author.get(author_id)
 
     # Check if author has active posts
     post_count = await BlogPost.find({"author": author.id}).count()
@@ -510,6 +1140,7 @@ async def delete_author(
         )
 
     await author.delete()
+    await invalidate_cache("stats")
     return MessageResponse(message="Author deleted successfully")
 
 
@@ -527,23 +1158,28 @@ async def delete_author(
 )
 async def create_post(data: BlogPostCreate) -> BlogPostResponse:
     """Create a new blog post with lifecycle hooks and audit logging."""
-    # v0.3.0+: String shortcut
-    author = await Author.get(data.author_id)
+    # Only the author's existence matters here: exists() reads just the _id
+    # of the match instead of loading (and decrypting) the whole author
+    author_id = ObjectId(data.author_id)
+    if not await Author.find(author_id).exists():
+        raise DocumentNotFound(f"Author with id '{author_id}' not found")
 
     try:
         post = await BlogPost.create(
             title=data.title,
             content=data.content,
-            author=author.id,
+            author=author_id,
             published=data.published,
             tags=data.tags,
             status=data.status,
             summary=data.summary,
         )
-        return BlogPostResponse.from_document(post)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
+    await invalidate_post_writes()
+    return BlogPostResponse.from_document(post)
+
 
 @app.get(
     "/posts/{post_id}",
@@ -552,23 +1188,74 @@ async def create_post(data: BlogPostCreate) -> BlogPostResponse:
     summary="Get blog post by ID",
 )
 async def get_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")],
+    request: Request,
+    post_id: PostId,
     populate: Annotated[bool, Query(
         description="Populate author details")] = True,
-) -> BlogPostResponse:
-    """Retrieve a single blog post by ID (excludes soft-deleted posts)."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
+) -> Response:
+    """Retrieve a single blog post by ID (excludes soft-deleted posts).
 
-    post = await BlogPost.get(ObjectId(post_id))
+    Sends an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
+    cache_key = ("post", post_id, populate)
+    post_response = await cache_get(cache_key, POST_CACHE_TTL, BlogPostResponse)
+    if post_response is None:
+        post = await load_live_post(post_id, populate)
+        post_response = BlogPostResponse.from_document(post, populate_author=populate)
+        await cache_set(cache_key, post_response, POST_CACHE_TTL)
+
+    return etag_response(request, post_response)
+
+
+async def query_posts(
+    skip: int,
+    limit: int,
+    after: Optional[str],
+    status: Optional[str],
+    tag: Optional[str],
+    search: Optional[str],
+    title_prefix: Optional[str],
+    populate: bool,
+    with_total: bool,
+) -> BlogPostListResponse:
+    """Run the list_posts query and build its response."""
+    filter_dict = {}  # SoftDeleteMixin automatically excludes soft-deleted posts
 
-    if post.deleted:
-        raise HTTPException(status_code=404, detail="Post has been deleted")
+    # Apply status filter
+    if status:
+        filter_dict["status"] = status
 
-    if populate:
-        await post.populate("author")
+    # Apply tag filter
+    if tag:
+        filter_dict["tags"] = tag
 
-    return BlogPostResponse.from_document(post, populate_author=populate)
+    # Apply search filter using the text index. Unlike an unanchored regex,
+    # $text doesn't scan every document; it matches whole (stemmed) words,
+    # case-insensitively.
+    if search:
+        filter_dict["$text"] = {"$search": search}
+
+    # Partial words can't use the text index. An anchored, case-sensitive
+    # prefix regex can use the title index as a bounded range scan; the
+    # input is escaped so it is always a literal prefix.
+    if title_prefix:
+        filter_dict["title"] = {"$regex": "^" + re.escape(title_prefix)}
+
+    # The page and the count share one base query
+    posts_query = BlogPost.find(filter_dict)
+    page_query = posts_query.select(*LIST_FIELDS)
+    if populate:
+        # Authors are joined with $lookup in the same aggregation
+        page_query = page_query.populate("author")
+    # Even with no conditions the count is filtered: SoftDeleteMixin adds
+    # deleted_at: None, so it is always a real count and worth caching
+    count_key = ("posts_count", status, tag, search, title_prefix)
+    # Without authors to join, posts are read as plain dicts and turned
+    # straight into list items
+    page = await fetch_page(
+        page_query, posts_query, skip, limit, after, count_key, with_total,
+        raw=not populate)
+    return post_list_response(page, skip, limit, raw=not populate)
 
 
 @app.get(
@@ -578,49 +1265,37 @@ async def get_post(
     summary="List all blog posts",
 )
 async def list_posts(
+    request: Request,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    after: AfterParam = None,
     status: Annotated[Optional[str], Query(
         description="Filter by status: draft, published, archived")] = None,
     tag: Annotated[Optional[str], Query(description="Filter by tag")] = None,
     search: Annotated[Optional[str], Query(
         description="Search in title/content")] = None,
+    title_prefix: Annotated[Optional[str], Query(
+        description="Titles starting with this text (case-sensitive)")] = None,
     populate: Annotated[bool, Query(
         description="Populate author details")] = True,
-) -> BlogPostListResponse:
-    """List blog posts with advanced filtering (MongoDB operators)."""
-    filter_dict = {}  # SoftDeleteMixin automatically excludes soft-deleted posts
-
-    # Apply status filter
-    if status:
-        filter_dict["status"] = status
-
-    # Apply tag filter
-    if tag:
-        filter_dict["tags"] = tag
+    with_total: WithTotalParam = True,
+) -> Response:
+    """List blog posts with advanced filtering (MongoDB operators).
 
-    # Apply search filter using MongoDB regex
-    if search:
-        filter_dict["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},  # Case-insensitive
-            {"content": {"$regex": search, "$options": "i"}},
-        ]
-
-    posts = await BlogPost.find(filter_dict).skip(skip).limit(limit).all()
-    total = await BlogPost.find(filter_dict).count()
-
-    if populate and posts:
-        for post in posts:
-            await post.populate("author")
-
-    return BlogPostListResponse(
-        items=[BlogPostResponse.from_document(
-            p, populate_author=populate) for p in posts],
-        total=total,
-        skip=skip,
-        limit=limit,
-        has_more=(skip + limit) < total,
+    Sends an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
+    cache_key = (
+        "posts", skip, limit, after, status, tag, search, title_prefix, populate,
+        with_total,
     )
+    page = await cache_get(cache_key, POST_LIST_CACHE_TTL, BlogPostListResponse)
+    if page is None:
+        page = await query_posts(
+            skip, limit, after, status, tag, search, title_prefix, populate,
+            with_total)
+        await cache_set(cache_key, page, POST_LIST_CACHE_TTL)
+
+    return etag_response(request, page)
 
 
 @app.put(
@@ -630,35 +1305,30 @@ async def list_posts(
     summary="Update a blog post",
 )
 async def update_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")],
+    post_id: PostId,
     data: BlogPostUpdate,
+    populate: Annotated[bool, Query(
+        description="Populate author details")] = False,
 ) -> BlogPostResponse:
-    """Update a blog post with lifecycle hooks."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
+    """Update a blog post in a single round trip.
 
-    post = await BlogPost.get(ObjectId(post_id))
-
-    if post.deleted:
-        raise HTTPException(status_code=404, detail="Post has been deleted")
+    Only the fields sent are written, with one find_one_and_update that
+    returns the updated post. BlogPostUpdate has already validated them.
+    """
+    changes = data.model_dump(exclude_none=True)
+    if not changes:
+        # Nothing to write; just return the current post
+        post = await load_live_post(post_id, populate)
+        return BlogPostResponse.from_document(post, populate_author=populate)
 
-    if data.title is not None:
-        post.title = data.title
-    if data.content is not None:
-        post.content = data.content
-    if data.status is not None:
-        post.status = data.status
-    if data.tags is not None:
-        post.tags = data.tags
-    if data.summary is not None:
-        post.summary = data.summary
+    post = await BlogPost.update_fields(post_id, changes)
+    if post is None:
+        await raise_post_missing(post_id)
+    await invalidate_post_writes(post_id)
 
-    try:
-        await post.save()
+    if populate:
         await post.populate("author")
-        return BlogPostResponse.from_document(post, populate_author=True)
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e))
+    return BlogPostResponse.from_document(post, populate_author=populate)
 
 
 @app.post(
@@ -668,19 +1338,17 @@ async def update_post(
     summary="Soft delete a blog post",
 )
 async def soft_delete_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> MessageResponse:
     """Soft delete a blog post (marks as deleted but preserves data)."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))
+    post = await BlogPost.get(post_id)
 
     if post.deleted:
         raise HTTPException(status_code=400, detail="Post is already deleted")
 
     # Use SoftDeleteMixin's built-in delete() method
     await post.delete()
+    await invalidate_post_writes(post_id)
 
     return MessageResponse(message="Post soft-deleted successfully")
 
@@ -692,13 +1360,10 @@ async def soft_delete_post(
     summary="Restore a soft-deleted blog post",
 )
 async def restore_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> MessageResponse:
     """Restore a soft-deleted blog post."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    # v0.3.0+: find_with_deleted() accepts string shortcut!
+    # find_with_deleted() also accepts an id (ObjectId or string)
     post = await BlogPost.find_with_deleted(post_id).first()
 
     if not post:
@@ -709,6 +1374,7 @@ async def restore_post(
 
     # Use SoftDeleteMixin's built-in restore() method
     await post.restore()
+    await invalidate_post_writes(post_id)
 
     return MessageResponse(message="Post restored successfully")
 
@@ -720,14 +1386,12 @@ async def restore_post(
     summary="Permanently delete a blog post",
 )
 async def delete_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> MessageResponse:
     """Permanently delete a blog post."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))
+    post = await BlogPost.get(post_id)
     await post.delete()
+    await invalidate_post_writes(post_id)
 
     return MessageResponse(message="Post permanently deleted")
 
@@ -739,27 +1403,30 @@ async def delete_post(
     summary="Publish a blog post",
 )
 async def publish_post(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId,
+    populate: Annotated[bool, Query(
+        description="Populate author details")] = False,
 ) -> BlogPostResponse:
     """Publish a blog post and update its status."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))
+    post = await BlogPost.publish(post_id)
 
-    if post.deleted:
-        raise HTTPException(status_code=404, detail="Post has been deleted")
-
-    if post.published:
+    if post is None:
+        # Nothing was updated; a small projected read says why
+        existing = await (
+            BlogPost.find_with_deleted(post_id).select("published", "deleted_at").first()
+        )
+        if existing is None:
+            raise DocumentNotFound(f"BlogPost with id '{post_id}' not found")
+        if existing.deleted:
+            raise HTTPException(status_code=404, detail="Post has been deleted")
         raise HTTPException(
             status_code=400, detail="Post is already published")
+    await invalidate_post_writes(post_id)
 
-    post.published = True
-    post.status = "published"
-    await post.save()
-    await post.populate("author")
+    if populate:
+        await post.populate("author")
 
-    return BlogPostResponse.from_document(post, populate_author=True)
+    return BlogPostResponse.from_document(post, populate_author=populate)
 
 
 @app.post(
@@ -769,19 +1436,16 @@ async def publish_post(
     summary="Increment post view count",
 )
 async def increment_view_count(
-    post_id: Annotated[str, Path(description="Post's ObjectId")]
+    post_id: PostId
 ) -> MessageResponse:
     """Increment the view count for a blog post."""
-    if not ObjectId.is_valid(post_id):
-        raise HTTPException(status_code=400, detail="Invalid post_id format")
-
-    post = await BlogPost.get(ObjectId(post_id))
-    post.views += 1
-    await post.save()
+    views = await BlogPost.increment_views(post_id)
+    # Only the post's own responses; see the response cache notes in 4.4
+    await invalidate_cache(post_id=post_id)
 
     return MessageResponse(
         message="View count incremented",
-        details={"views": post.views},
+        details={"views": views},
     )
 
 
@@ -797,35 +1461,30 @@ async def increment_view_count(
     summary="Get posts by author",
 )
 async def get_posts_by_author(
-    author_id: Annotated[str, Path(description="Author's ObjectId")],
+    author_id: AuthorId,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    after: AfterParam = None,
+    with_total: WithTotalParam = True,
 ) -> BlogPostListResponse:
     """Get all blog posts by a specific author."""
-    if not ObjectId.is_valid(author_id):
-        raise HTTPException(status_code=400, detail="Invalid author_id format")
-
-    author = await Author.get(ObjectId(author_id))
-
-    posts = (
-        await BlogPost.find({"author": author.id})
-        .skip(skip)
-        .limit(limit)
-        .all()
-    )
-    total = await BlogPost.find({"author": author.id, "deleted": False}).count()
-
-    for post in posts:
-        await post.populate("author")
-
-    return BlogPostListResponse(
-        items=[BlogPostResponse.from_document(
-            p, populate_author=True) for p in posts],
-        total=total,
-        skip=skip,
-        limit=limit,
-        has_more=(skip + limit) < total,
+    # Every post has the same author, so load it once (alongside the page)
+    # instead of joining it into each post
+    posts_query = BlogPost.find({"author": author_id})
+    author, page = await asyncio.gather(
+        Author.get(author_id),
+        fetch_page(
+            posts_query.select(*LIST_FIELDS),
+            posts_query,
+            skip,
+            limit,
+            after,
+            ("author_posts_count", author_id),
+            with_total,
+            raw=True,
+        ),
     )
+    return post_list_response(page, skip, limit, author, raw=True)
 
 
 @app.get(
@@ -838,27 +1497,31 @@ async def search_posts_by_tag(
     tag: Annotated[str, Path(description="Tag to search for")],
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    after: AfterParam = None,
+    with_total: WithTotalParam = True,
+    search: Annotated[Optional[str], Query(
+        description="Only posts with these words in title/content")] = None,
 ) -> BlogPostListResponse:
-    """Search blog posts by tag."""
-    posts = (
-        await BlogPost.find({"tags": tag})
-        .skip(skip)
-        .limit(limit)
-        .all()
-    )
-    total = await BlogPost.find({"tags": tag, "deleted": False}).count()
+    """Search blog posts by tag.
 
-    for post in posts:
-        await post.populate("author")
-
-    return BlogPostListResponse(
-        items=[BlogPostResponse.from_document(
-            p, populate_author=True) for p in posts],
-        total=total,
-        skip=skip,
-        limit=limit,
-        has_more=(skip + limit) < total,
+    With search, the text index finds the matching posts first and the tag
+    is checked on just those, which beats walking every post with a common
+    tag.
+    """
+    filter_dict = {"tags": tag}
+    if search:
+        filter_dict["$text"] = {"$search": search}
+    posts_query = BlogPost.find(filter_dict)
+    page = await fetch_page(
+        posts_query.select(*LIST_FIELDS).populate("author"),
+        posts_query,
+        skip,
+        limit,
+        after,
+        ("tag_posts_count", tag, search),
+        with_total,
     )
+    return post_list_response(page, skip, limit)
 
 
 # ============================================================================
@@ -874,32 +1537,25 @@ async def search_posts_by_tag(
 )
 async def get_statistics() -> StatsResponse:
     """Get comprehensive blog statistics."""
-    total_authors = await Author.find().count()
-    verified_authors = await Author.find({"verified": True}).count()
-
-    # SoftDeleteMixin automatically excludes soft-deleted posts
-    total_posts = await BlogPost.find().count()
-    published_posts = await BlogPost.find({"published": True}).count()
-    draft_posts = await BlogPost.find({"status": "draft"}).count()
-    archived_posts = await BlogPost.find({"status": "archived"}).count()
-
-    # To count soft-deleted posts, use find_deleted()
-    deleted_posts = await BlogPost.find_deleted().count()
-
-    # Calculate total views
-    posts_with_views = await BlogPost.find().all()
-    total_views = sum(p.views for p in posts_with_views)
-
-    return StatsResponse(
-        total_authors=total_authors,
-        verified_authors=verified_authors,
-        total_posts=total_posts,
-        published_posts=published_posts,
-        draft_posts=draft_posts,
-        archived_posts=archived_posts,
-        deleted_posts=deleted_posts,
-        total_views=total_views,
+    cached = await cache_get(("stats",), STATS_CACHE_TTL, StatsResponse)
+    if cached is not None:
+        return cached
+
+    # One aggregation per collection, run concurrently
+    authors, posts = await asyncio.gather(Author.stats(), BlogPost.stats())
+
+    response = StatsResponse(
+        total_authors=authors["total"],
+        verified_authors=authors["verified"],
+        total_posts=posts["total"],
+        published_posts=posts["published"],
+        draft_posts=posts["draft"],
+        archived_posts=posts["archived"],
+        deleted_posts=posts["deleted"],
+        total_views=posts["views"],
     )
+    await cache_set(("stats",), response, STATS_CACHE_TTL)
+    return response
 
 
 # ============================================================================
@@ -907,69 +1563,76 @@ async def get_statistics() -> StatsResponse:
 # ============================================================================
 
 
+# These bodies never change, so they are encoded once at import time instead of
+# being rebuilt and serialized on every request (health probes hit these often).
+_HEALTH_BODY = MessageResponse(
+    message="healthy",
+    details={
+        "service": "Pygoose Blog API (Full Features)",
+        "version": "2.0.0",
+        "features": [
+            "CRUD operations",
+            "Reference population",
+            "Timestamps",
+            "Soft delete",
+            "Audit logging",
+            "Encrypted fields",
+            "Indexed fields",
+            "Lifecycle hooks",
+            "Advanced querying",
+        ],
+    },
+).model_dump_json().encode()
+
+_ROOT_BODY = to_json({
+    "service": "Pygoose Blog API (Full Feature Set)",
+    "version": "2.0.0",
+    "description": "Production-ready blog API showcasing all Pygoose features",
+    "features": {
+        "core": ["CRUD", "Querying", "Pagination"],
+        "advanced": [
+            "Soft Delete (SoftDeleteMixin)",
+            "Audit Logging (AuditMixin)",
+            "Timestamps (TimestampsMixin)",
+            "Field Encryption (Encrypted)",
+            "Field Indexing (Indexed)",
+            "Lifecycle Hooks (pre_save, post_save, etc.)",
+            "MongoDB Operators (text search, comparison)",
+            "Reference Population (Ref, LazyRef)",
+        ],
+    },
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc",
+    },
+    "endpoints": {
+        "authors": "/authors",
+        "posts": "/posts",
+        "search": {
+            "by_author": "/authors/{author_id}/posts",
+            "by_tag": "/posts/search/by-tag/{tag}",
+        },
+        "stats": "/stats",
+        "health": "/health",
+    },
+})
+
+
 @app.get(
     "/health",
     response_model=MessageResponse,
     tags=["Health"],
     summary="Health check",
 )
-async def health_check() -> MessageResponse:
+async def health_check() -> Response:
     """Health check endpoint to verify API is running."""
-    return MessageResponse(
-        message="healthy",
-        details={
-            "service": "Pygoose Blog API (Full Features)",
-            "version": "2.0.0",
-            "features": [
-                "CRUD operations",
-                "Reference population",
-                "Timestamps",
-                "Soft delete",
-                "Audit logging",
-                "Encrypted fields",
-                "Indexed fields",
-                "Lifecycle hooks",
-                "Advanced querying",
-            ],
-        },
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict:
+async def root() -> Response:
     """Root endpoint with API information."""
-    return {
-        "service": "Pygoose Blog API (Full Feature Set)",
-        "version": "2.0.0",
-        "description": "Production-ready blog API showcasing all Pygoose features",
-        "features": {
-            "core": ["CRUD", "Querying", "Pagination"],
-            "advanced": [
-                "Soft Delete (SoftDeleteMixin)",
-                "Audit Logging (AuditMixin)",
-                "Timestamps (TimestampsMixin)",
-                "Field Encryption (Encrypted)",
-                "Field Indexing (Indexed)",
-                "Lifecycle Hooks (pre_save, post_save, etc.)",
-                "MongoDB Operators (regex, comparison)",
-                "Reference Population (Ref, LazyRef)",
-            ],
-        },
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc",
-        },
-        "endpoints": {
-            "authors": "/authors",
-            "posts": "/posts",
-            "search": {
-                "by_author": "/authors/{author_id}/posts",
-                "by_tag": "/posts/search/by-tag/{tag}",
-            },
-            "stats": "/stats",
-            "health": "/health",
-        },
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # ============================================================================
@@ -1003,7 +1666,7 @@ FEATURES DEMONSTRATED:
    - ObjectId shortcuts: find("507f..."), get("507f...")
    - QuerySet.filter() shortcuts
    - SoftDeleteMixin shortcuts: find_deleted("507f..."), find_with_deleted("507f...")
-   - Advanced filtering with MongoDB operators ($regex, $options)
+   - Advanced filtering with MongoDB operators ($text search)
    - Complex queries with multiple conditions
    - Text search capabilities
 
@@ -25,6 +25,7 @@ from pydantic import EmailStr
 
 from pygoose import (
     Document,
+    PyObjectId,
     Ref,
     Encrypted,
     connect,
@@ -35,6 +36,7 @@ from pygoose import (
 from pygoose.plugins import TimestampsMixin, SoftDeleteMixin, AuditMixin
 from pygoose.lifecycle.hooks import pre_save, post_save, pre_delete
 from pygoose.integrations import init_app
+from pygoose.utils.exceptions import DocumentNotFound
 from pygoose.utils.pagination import Page
 
 
@@ -60,6 +62,12 @@ class User(TimestampsMixin, AuditMixin, Document):
 
     class Settings:
         collection = "users"
+        # Serves find(age={"$gte": ...}) and sort("-age"). email is encrypted
+        # with a random nonce, so an index (or unique constraint) on it would
+        # never match a plaintext lookup.
+        indexes = [
+            {"fields": [("age", -1)]},
+        ]
 
 
 class Post(SoftDeleteMixin, TimestampsMixin, Document):
@@ -80,6 +88,9 @@ class Post(SoftDeleteMixin, TimestampsMixin, Document):
 
     class Settings:
         collection = "posts"
+        indexes = [
+            {"fields": [("author", 1)]},
+        ]
 
 
 class Comment(Document):
@@ -97,6 +108,10 @@ class Comment(Document):
 
     class Settings:
         collection = "comments"
+        indexes = [
+            {"fields": [("post", 1)]},
+            {"fields": [("author", 1)]},
+        ]
 
     @pre_save
     async def validate_comment(self):
@@ -117,8 +132,8 @@ class Product(Document):
     class Settings:
         collection = "products"
         indexes = [
-            {"keys": [("name", 1)], "unique": False},
-            {"keys": [("seller", 1)], "unique": False},
+            {"fields": [("name", 1)]},
+            {"fields": [("seller", 1)]},
         ]
 
 
@@ -193,14 +208,12 @@ async def example_2_queryset_api():
 
     # Create test users
     print("\n1️⃣  Creating test users...")
-    users = []
-    for i in range(5):
-        user = await User.create(
-            name=f"User {i}",
-            email=f"user{i}@example.com",
-            age=20 + i,
-        )
-        users.append(user)
+    # One insert_many round trip instead of one create() per user
+    users = await User.insert_many([
+        User(name=f"User {i}", email=f"user{i}@example.com", age=20 + i)
+        for i in range(5)
+    ])
+    for user in users:
         print(f"   Created: {user.name} (age {user.age})")
 
     # FIND
@@ -230,12 +243,12 @@ async def example_2_queryset_api():
 
     # SORT & LIMIT
     print("\n7️⃣  Find users sorted by age, limit 2...")
-    top_users = await User.find().sort("age", -1).limit(2).all()
+    top_users = await User.find().sort("-age").limit(2).all()
     print(f"   Top 2 by age: {[(u.name, u.age) for u in top_users]}")
 
     # PAGINATION
     print("\n8️⃣  Paginate through users (page size 2)...")
-    page = await User.find().paginate(page=1, page_size=2)
+    page = await User.find().paginate(page=1, size=2)
     print(f"   Page 1: {[u.name for u in page.items]} (total: {page.total})")
 
     return users
@@ -254,15 +267,16 @@ async def example_3_references_population():
 
     # Create posts referencing the author
     print("\n2️⃣  Creating posts...")
-    posts = []
-    for i in range(3):
-        post = await Post.create(
+    posts = await Post.insert_many([
+        Post(
             title=f"Post {i}",
             content=f"Content of post {i}",
             author=Ref(User, author.id),
             tags=["python", "mongodb"],
         )
-        posts.append(post)
+        for i in range(3)
+    ])
+    for post in posts:
         print(f"   Created: {post.title}")
 
     # Load without population (reference is ObjectId)
@@ -273,15 +287,14 @@ async def example_3_references_population():
 
     # Load with population (reference is full document)
     print("\n4️⃣  Fetch post WITH population...")
-    populated_post = await Post.get(posts[0].id)
-    await populated_post.populate("author")
+    # populate() on a QuerySet joins the author with $lookup: one round trip
+    populated_post = await Post.find(posts[0].id).populate("author").first()
     print(f"   Post: {populated_post.title}")
     print(f"   Author (populated): {populated_post.author.name}")
 
     # Batch population (efficient)
     print("\n5️⃣  Batch populate multiple posts...")
-    all_posts = await Post.find().all()
-    await Post.find().populate("author").all()
+    all_posts = await Post.find().populate("author").all()
     print(f"   Populated {len(all_posts)} posts")
 
     # Nested population (Post -> Comment -> User)
@@ -291,16 +304,17 @@ async def example_3_references_population():
         author=Ref(User, author.id),
         post=Ref(Post, posts[0].id),
     )
-    await comment.populate("author", "post")
+    # Each populated field adds one $lookup stage to the same query
+    comment = await Comment.find(comment.id).populate("author", "post").first()
     print(f"   Comment: {comment.text}")
     print(f"   By: {comment.author.name}")
     print(f"   On: {comment.post.title}")
 
     # Deep nested population
-    print("\n7️⃣  Deep nested population (Post -> User)...")
-    deep_post = await Post.get(posts[0].id)
-    await deep_post.populate("author")
-    print(f"   Post author: {deep_post.author.name} ({deep_post.author.email})")
+    print("\n7️⃣  Deep nested population (Comment -> Post -> User)...")
+    deep_comment = await Comment.find(comment.id).populate("post.author").first()
+    post_author = deep_comment.post.author
+    print(f"   Post author: {post_author.name} ({post_author.email})")
 
     return posts, author
 
@@ -387,16 +401,10 @@ async def example_6_soft_delete():
     author = await User.create(name="Eve Adams", email="eve@example.com")
 
     print("\n1️⃣  Creating posts...")
-    post1 = await Post.create(
-        title="Post 1",
-        content="Content 1",
-        author=Ref(User, author.id),
-    )
-    post2 = await Post.create(
-        title="Post 2",
-        content="Content 2",
-        author=Ref(User, author.id),
-    )
+    post1, post2 = await Post.insert_many([
+        Post(title="Post 1", content="Content 1", author=Ref(User, author.id)),
+        Post(title="Post 2", content="Content 2", author=Ref(User, author.id)),
+    ])
     print(f"   Created 2 posts")
 
     print("\n2️⃣  Finding all active posts...")
@@ -477,25 +485,24 @@ async def example_9_pagination():
     print("=" * 70)
 
     print("\n1️⃣  Creating 10 test users...")
-    for i in range(10):
-        await User.create(
-            name=f"User {i:02d}",
-            email=f"user{i:02d}@example.com",
-            age=20 + i,
-        )
+    await User.insert_many([
+        User(name=f"User {i:02d}", email=f"user{i:02d}@example.com", age=20 + i)
+        for i in range(10)
+    ])
     print(f"   Created 10 users")
 
     print("\n2️⃣  Paginating (page 1, size 3)...")
-    page1 = await User.find().paginate(page=1, page_size=3)
+    # Items and total come back from one $facet aggregation
+    page1 = await User.find().paginate(page=1, size=3)
     print(f"   Page 1: {[u.name for u in page1.items]}")
-    print(f"   Total: {page1.total}, Pages: {page1.pages}")
+    print(f"   Total: {page1.total}, Pages: {page1.total_pages}")
 
     print("\n3️⃣  Paginating (page 2, size 3)...")
-    page2 = await User.find().paginate(page=2, page_size=3)
+    page2 = await User.find().paginate(page=2, size=3)
     print(f"   Page 2: {[u.name for u in page2.items]}")
 
     print("\n4️⃣  Paginating with sort...")
-    page = await User.find().sort("age", -1).paginate(page=1, page_size=3)
+    page = await User.find().sort("-age").paginate(page=1, size=3)
     print(f"   Oldest users: {[(u.name, u.age) for u in page.items]}")
 
 
@@ -531,11 +538,10 @@ def create_fastapi_app():
         return {"id": str(user.id), "name": user.name}
 
     @app.get("/users/{user_id}")
-    async def get_user(user_id: str):
+    async def get_user(user_id: PyObjectId):
         """Get user by ID."""
-        from bson import ObjectId
-
-        user = await User.get(ObjectId(user_id))
+        # PyObjectId parses the path value once; malformed ids get a 422
+        user = await User.get(user_id)
         return {
             "id": str(user.id),
             "name": user.name,
@@ -544,34 +550,35 @@ def create_fastapi_app():
         }
 
     @app.get("/users")
-    async def list_users(skip: int = 0, limit: int = 10):
+    async def list_users(page: int = 1, size: int = 10):
         """List users with pagination."""
-        page = await User.find().skip(skip).limit(limit).all()
-        total = await User.find().count()
+        # Only id and name are returned: project to those and read the raw
+        # dicts instead of validating a User per row
+        qs = User.find().select("name").skip((page - 1) * size).limit(size)
+        docs, total = await asyncio.gather(qs.raw(), User.find().count())
         return {
-            "items": [{"id": str(u.id), "name": u.name} for u in page],
+            "items": [{"id": str(d["_id"]), "name": d["name"]} for d in docs],
             "total": total,
         }
 
     @app.post("/posts/{user_id}")
-    async def create_post(user_id: str, title: str, content: str):
+    async def create_post(user_id: PyObjectId, title: str, content: str):
         """Create a post by user."""
-        from bson import ObjectId
-
         post = await Post.create(
             title=title,
             content=content,
-            author=Ref(User, ObjectId(user_id)),
+            author=Ref(User, user_id),
         )
         return {"id": str(post.id), "title": post.title}
 
     @app.get("/posts/{post_id}")
-    async def get_post(post_id: str):
+    async def get_post(post_id: PyObjectId):
         """Get post with author populated."""
-        from bson import ObjectId
-
-        post = await Post.get(ObjectId(post_id))
-        await post.populate("author")
+        # find() + populate() runs as one aggregation with a $lookup for the
+        # author, instead of get() followed by a second query
+        post = await Post.find(post_id).populate("author").first()
+        if post is None:
+            raise DocumentNotFound(f"Post with id '{post_id}' not found")
         return {
             "id": str(post.id),
             "title": post.title,
@@ -612,7 +619,13 @@ async def main():
     print("✅ Encryption configured")
 
     try:
-        # Run examples
+        # Create the indexes declared in each document's Settings
+        await asyncio.gather(*(doc.ensure_indexes() for doc in (User, Post, Comment, Product)))
+        print("✅ Indexes ready")
+
+        # Run examples one at a time: they share the users/posts collections
+        # and several of them count or page through everything in them, so
+        # running them concurrently would change each other's output.
         await example_1_basic_crud()
         await example_2_queryset_api()
         await example_3_references_population()
@@ -635,6 +648,8 @@ async def main():
         print("  import uvicorn; \\")
         print("  app = create_fastapi_app(); \\")
         print("  uvicorn.run(app, host='0.0.0.0', port=8000)\"")
+        print("\nWith uvicorn[standard] installed, uvicorn runs on uvloop and")
+        print("httptools automatically (its default loop/http settings are 'auto').")
         print("\nThen visit:")
         print("  - API Docs: http://localhost:8000/docs")
         print("  - ReDoc: http://localhost:8000/redoc")
@@ -645,4 +660,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; use it when installed, otherwise the stock loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
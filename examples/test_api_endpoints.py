@@ -5,16 +5,64 @@ Tests all CRUD operations, references, pagination, search, and error handling.
 
 Run with: uv run python test_api_endpoints.py
 (Make sure the FastAPI server is running first)
+
+Load mode repeats the read-only endpoints from concurrent virtual users and
+reports throughput and latency percentiles instead of running the tests:
+
+    uv run python test_api_endpoints.py --load --vus 50 --iterations 200
 """
 
+import argparse
 import asyncio
+import contextvars
 import httpx
 import json
+import statistics
+import time
 from typing import Any, Optional
 
+from pydantic_core import from_json, to_json
+
 # Configuration
 BASE_URL = "http://localhost:8000"
 TIMEOUT = 30.0
+# Keep connections open across tests; httpx closes idle ones after 5s by
+# default, so a slow test made the next request reconnect
+KEEPALIVE_EXPIRY = 30.0
+MAX_CONNECTIONS = 100
+
+# Read-only requests each virtual user repeats in load mode
+LOAD_PATHS = (
+    "/authors?skip=0&limit=10",
+    "/posts?skip=0&limit=10",
+    "/posts/search/by-tag/python?skip=0&limit=10",
+    "/stats",
+)
+
+# Request bodies that never change, encoded once instead of on every request
+# (bodies that include a created id are still built per call)
+JSON_HEADERS = {"content-type": "application/json"}
+CREATE_AUTHOR_BODY = to_json({
+    "name": "Alice Johnson",
+    "email": "alice@example.com",
+    "bio": "Tech writer and blogger",
+})
+INVALID_AUTHOR_BODY = to_json({"name": "Bob Smith"})
+UPDATE_AUTHOR_BODY = to_json({"name": "Alice Johnson Updated", "bio": "Updated bio"})
+UNKNOWN_AUTHOR_POST_BODY = to_json({
+    "title": "Test Post",
+    "content": "Test content",
+    "author_id": "507f1f77bcf86cd799439011",
+    "tags": [],
+})
+INVALID_AUTHOR_ID_POST_BODY = to_json({
+    "title": "Test Post",
+    "content": "Test content",
+    "author_id": "invalid-id",
+    "tags": [],
+})
+UPDATE_POST_BODY = to_json({"title": "Updated Title", "content": "Updated content..."})
+SECOND_AUTHOR_BODY = to_json({"name": "Bob Smith", "email": "bob@example.com"})
 
 # Color codes for output
 GREEN = "\033[92m"
@@ -24,13 +72,28 @@ BLUE = "\033[94m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Output lines of the test running in the current task, set while tests run
+# concurrently so each test's lines are printed together
+_test_output: contextvars.ContextVar[Optional[list[str]]] = contextvars.ContextVar(
+    "_test_output", default=None
+)
+
 
 class APIValidator:
     """Validates FastAPI endpoints."""
 
     def __init__(self, base_url: str = BASE_URL):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(base_url=base_url, timeout=TIMEOUT)
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        # The client ignores limits= when given a transport, so they go here
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=0)
+        self.client = httpx.AsyncClient(
+            base_url=base_url, timeout=TIMEOUT, transport=transport
+        )
         self.test_count = 0
         self.passed = 0
         self.failed = 0
@@ -41,24 +104,56 @@ class APIValidator:
         """Close the HTTP client."""
         await self.client.aclose()
 
+    async def __aenter__(self) -> "APIValidator":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _emit(self, line: str):
+        """Print a line, or hold it until the current concurrent test ends."""
+        buffer = _test_output.get()
+        if buffer is None:
+            print(line)
+        else:
+            buffer.append(line)
+
     def log_test(self, name: str):
         """Log test name."""
         self.test_count += 1
-        print(f"\n{BLUE}Test {self.test_count}: {name}{RESET}")
+        self._emit(f"\n{BLUE}Test {self.test_count}: {name}{RESET}")
 
     def log_pass(self, message: str = "✅ Passed"):
         """Log passed test."""
         self.passed += 1
-        print(f"{GREEN}{message}{RESET}")
+        self._emit(f"{GREEN}{message}{RESET}")
 
     def log_fail(self, message: str):
         """Log failed test."""
         self.failed += 1
-        print(f"{RED}❌ Failed: {message}{RESET}")
+        self._emit(f"{RED}❌ Failed: {message}{RESET}")
 
     def log_info(self, message: str):
         """Log info message."""
-        print(f"{YELLOW}ℹ️  {message}{RESET}")
+        self._emit(f"{YELLOW}ℹ️  {message}{RESET}")
+
+    async def _run_buffered(self, test):
+        """Run one test, printing its output as a single block at the end."""
+        buffer: list[str] = []
+        _test_output.set(buffer)  # gather() gives each test its own context
+        try:
+            await test()
+        finally:
+            print("\n".join(buffer))
+
+    async def run_concurrently(self, *tests):
+        """Run tests that don't depend on each other at the same time."""
+        await asyncio.gather(*(self._run_buffered(test) for test in tests))
+
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a JSON response body with pydantic-core's parser."""
+        return from_json(response.content)
 
     async def assert_status(self, response: httpx.Response, expected: int, test_name: str) -> bool:
         """Assert response status code."""
@@ -88,7 +183,7 @@ class APIValidator:
         self.log_test("Health Check")
         response = await self.client.get("/health")
         await self.assert_status(response, 200, "health check")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "message", "health check")
 
     async def test_root(self):
@@ -96,7 +191,7 @@ class APIValidator:
         self.log_test("Root Endpoint")
         response = await self.client.get("/")
         await self.assert_status(response, 200, "root")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "service", "root")
         await self.assert_field(data, "version", "root")
 
@@ -105,14 +200,10 @@ class APIValidator:
     async def test_create_author_valid(self):
         """Test creating an author with valid data."""
         self.log_test("Create Author (Valid)")
-        payload = {
-            "name": "Alice Johnson",
-            "email": "alice@example.com",
-            "bio": "Tech writer and blogger",
-        }
-        response = await self.client.post("/authors", json=payload)
+        response = await self.client.post(
+            "/authors", content=CREATE_AUTHOR_BODY, headers=JSON_HEADERS)
         await self.assert_status(response, 201, "create author")
-        data = response.json()
+        data = self._json(response)
         author_id = await self.assert_field(data, "id", "create author")
         if author_id:
             self.author_ids.append(author_id)
@@ -121,8 +212,8 @@ class APIValidator:
     async def test_create_author_invalid(self):
         """Test creating an author with invalid data (missing required field)."""
         self.log_test("Create Author (Invalid - missing email)")
-        payload = {"name": "Bob Smith"}
-        response = await self.client.post("/authors", json=payload)
+        response = await self.client.post(
+            "/authors", content=INVALID_AUTHOR_BODY, headers=JSON_HEADERS)
         if response.status_code >= 400:
             self.log_pass(f"Correctly rejected with status {response.status_code}")
         else:
@@ -138,7 +229,7 @@ class APIValidator:
         author_id = self.author_ids[0]
         response = await self.client.get(f"/authors/{author_id}")
         await self.assert_status(response, 200, "get author")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "id", "get author")
         await self.assert_field(data, "name", "get author")
 
@@ -166,7 +257,7 @@ class APIValidator:
         self.log_test("List Authors")
         response = await self.client.get("/authors?skip=0&limit=10")
         await self.assert_status(response, 200, "list authors")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "items", "list authors")
         await self.assert_field(data, "total", "list authors")
         await self.assert_field(data, "has_more", "list authors")
@@ -188,10 +279,10 @@ class APIValidator:
             return
 
         author_id = self.author_ids[0]
-        payload = {"name": "Alice Johnson Updated", "bio": "Updated bio"}
-        response = await self.client.put(f"/authors/{author_id}", json=payload)
+        response = await self.client.put(
+            f"/authors/{author_id}", content=UPDATE_AUTHOR_BODY, headers=JSON_HEADERS)
         await self.assert_status(response, 200, "update author")
-        data = response.json()
+        data = self._json(response)
         author_data = data.get("id")
         if author_data:
             self.log_pass(f"Author updated: {author_data}")
@@ -214,7 +305,7 @@ class APIValidator:
         }
         response = await self.client.post("/posts", json=payload)
         await self.assert_status(response, 201, "create post")
-        data = response.json()
+        data = self._json(response)
         post_id = await self.assert_field(data, "id", "create post")
         if post_id:
             self.post_ids.append(post_id)
@@ -223,14 +314,8 @@ class APIValidator:
     async def test_create_post_invalid_author(self):
         """Test creating a post with non-existent author."""
         self.log_test("Create Blog Post (Invalid author)")
-        valid_oid = "507f1f77bcf86cd799439011"
-        payload = {
-            "title": "Test Post",
-            "content": "Test content",
-            "author_id": valid_oid,
-            "tags": [],
-        }
-        response = await self.client.post("/posts", json=payload)
+        response = await self.client.post(
+            "/posts", content=UNKNOWN_AUTHOR_POST_BODY, headers=JSON_HEADERS)
         if response.status_code == 404:
             self.log_pass("Correctly rejected non-existent author")
         else:
@@ -239,13 +324,8 @@ class APIValidator:
     async def test_create_post_invalid_id_format(self):
         """Test creating a post with invalid author_id format."""
         self.log_test("Create Blog Post (Invalid author_id format)")
-        payload = {
-            "title": "Test Post",
-            "content": "Test content",
-            "author_id": "invalid-id",
-            "tags": [],
-        }
-        response = await self.client.post("/posts", json=payload)
+        response = await self.client.post(
+            "/posts", content=INVALID_AUTHOR_ID_POST_BODY, headers=JSON_HEADERS)
         if response.status_code >= 400:
             self.log_pass(f"Correctly rejected invalid author_id format")
         else:
@@ -261,7 +341,7 @@ class APIValidator:
         post_id = self.post_ids[0]
         response = await self.client.get(f"/posts/{post_id}?populate=true")
         await self.assert_status(response, 200, "get post")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "id", "get post")
         await self.assert_field(data, "title", "get post")
         author = await self.assert_field(data, "author", "get post")
@@ -278,7 +358,7 @@ class APIValidator:
         post_id = self.post_ids[0]
         response = await self.client.get(f"/posts/{post_id}?populate=false")
         await self.assert_status(response, 200, "get post")
-        data = response.json()
+        data = self._json(response)
         author = data.get("author")
         if author is None:
             self.log_pass("Author not populated as expected")
@@ -290,7 +370,7 @@ class APIValidator:
         self.log_test("List Posts")
         response = await self.client.get("/posts?skip=0&limit=10&populate=true")
         await self.assert_status(response, 200, "list posts")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "items", "list posts")
         await self.assert_field(data, "total", "list posts")
         await self.assert_field(data, "has_more", "list posts")
@@ -300,7 +380,7 @@ class APIValidator:
         self.log_test("List Posts (Published only)")
         response = await self.client.get("/posts?published_only=true")
         await self.assert_status(response, 200, "list posts")
-        data = response.json()
+        data = self._json(response)
         for item in data.get("items", []):
             if not item.get("published"):
                 self.log_fail("Found unpublished post in published_only query")
@@ -315,13 +395,10 @@ class APIValidator:
             return
 
         post_id = self.post_ids[0]
-        payload = {
-            "title": "Updated Title",
-            "content": "Updated content...",
-        }
-        response = await self.client.put(f"/posts/{post_id}", json=payload)
+        response = await self.client.put(
+            f"/posts/{post_id}", content=UPDATE_POST_BODY, headers=JSON_HEADERS)
         await self.assert_status(response, 200, "update post")
-        data = response.json()
+        data = self._json(response)
         title = data.get("title")
         if title == "Updated Title":
             self.log_pass(f"Post title updated: {title}")
@@ -338,15 +415,12 @@ class APIValidator:
         post_id = self.post_ids[0]
         # Get initial views
         get_response = await self.client.get(f"/posts/{post_id}?populate=false")
-        initial_views = get_response.json().get("views", 0)
+        initial_views = self._json(get_response).get("views", 0)
 
-        # Increment
+        # Increment; the response reports the new count, so no second read
         response = await self.client.post(f"/posts/{post_id}/view")
         await self.assert_status(response, 200, "increment view")
-
-        # Get updated views
-        get_response = await self.client.get(f"/posts/{post_id}?populate=false")
-        new_views = get_response.json().get("views", 0)
+        new_views = (self._json(response).get("details") or {}).get("views", 0)
 
         if new_views == initial_views + 1:
             self.log_pass(f"Views incremented: {initial_views} -> {new_views}")
@@ -363,7 +437,7 @@ class APIValidator:
         post_id = self.post_ids[0]
         response = await self.client.post(f"/posts/{post_id}/publish")
         await self.assert_status(response, 200, "publish post")
-        data = response.json()
+        data = self._json(response)
         published = data.get("published")
         if published:
             self.log_pass("Post published successfully")
@@ -396,7 +470,7 @@ class APIValidator:
         author_id = self.author_ids[0]
         response = await self.client.get(f"/authors/{author_id}/posts?skip=0&limit=10")
         await self.assert_status(response, 200, "search by author")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "items", "search by author")
         posts = data.get("items", [])
         self.log_info(f"Found {len(posts)} posts by author")
@@ -406,7 +480,7 @@ class APIValidator:
         self.log_test("Search Posts by Tag")
         response = await self.client.get("/posts/search/by-tag/python?skip=0&limit=10")
         await self.assert_status(response, 200, "search by tag")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "items", "search by tag")
         posts = data.get("items", [])
         self.log_info(f"Found {len(posts)} posts with tag 'python'")
@@ -418,7 +492,7 @@ class APIValidator:
         self.log_test("Statistics")
         response = await self.client.get("/stats")
         await self.assert_status(response, 200, "statistics")
-        data = response.json()
+        data = self._json(response)
         await self.assert_field(data, "total_authors", "statistics")
         await self.assert_field(data, "total_posts", "statistics")
         await self.assert_field(data, "published_posts", "statistics")
@@ -466,12 +540,9 @@ class APIValidator:
         """Test deleting an author without posts."""
         self.log_test("Delete Author (Without posts)")
         # Create a new author with no posts
-        payload = {
-            "name": "Bob Smith",
-            "email": "bob@example.com",
-        }
-        create_response = await self.client.post("/authors", json=payload)
-        author_id = create_response.json().get("id")
+        create_response = await self.client.post(
+            "/authors", content=SECOND_AUTHOR_BODY, headers=JSON_HEADERS)
+        author_id = self._json(create_response).get("id")
 
         if not author_id:
             self.log_fail("Could not create test author")
@@ -484,46 +555,56 @@ class APIValidator:
     # ========== SUMMARY ==========
 
     async def run_all_tests(self):
-        """Run all tests in order."""
+        """Run all tests, in stages ordered by the data they need.
+
+        Tests within a stage are independent of each other and run
+        concurrently. Writes to the shared post run one at a time: the
+        view count test reads the post before and after its write, and a
+        post can only be published once.
+        """
         print(f"\n{BOLD}{'=' * 70}")
         print(f"FastAPI Endpoint Validation Suite")
         print(f"{'=' * 70}{RESET}\n")
 
         try:
-            # Health & Root
-            await self.test_health_check()
-            await self.test_root()
+            # No test data needed: health, root and rejected requests
+            await self.run_concurrently(
+                self.test_health_check,
+                self.test_root,
+                self.test_create_author_invalid,
+                self.test_get_author_invalid_id,
+                self.test_get_author_not_found,
+                self.test_list_authors_pagination,
+                self.test_create_post_invalid_author,
+                self.test_create_post_invalid_id_format,
+            )
 
-            # Author CRUD
+            # Author CRUD (everything after this needs the author)
             await self.test_create_author_valid()
-            await self.test_create_author_invalid()
-            await self.test_get_author_valid()
-            await self.test_get_author_invalid_id()
-            await self.test_get_author_not_found()
-            await self.test_list_authors()
-            await self.test_list_authors_pagination()
-            await self.test_update_author()
-
-            # Blog Post CRUD
-            await self.test_create_post_valid()
-            await self.test_create_post_invalid_author()
-            await self.test_create_post_invalid_id_format()
-            await self.test_get_post_with_population()
-            await self.test_get_post_without_population()
-            await self.test_list_posts()
-            await self.test_list_posts_published_only()
+            await self.run_concurrently(
+                self.test_get_author_valid,
+                self.test_list_authors,
+                self.test_update_author,
+                self.test_create_post_valid,
+            )
+
+            # Blog post reads, search and statistics
+            await self.run_concurrently(
+                self.test_get_post_with_population,
+                self.test_get_post_without_population,
+                self.test_list_posts,
+                self.test_list_posts_published_only,
+                self.test_search_posts_by_author,
+                self.test_search_posts_by_tag,
+                self.test_statistics,
+            )
+
+            # Blog post writes, one at a time
             await self.test_update_post()
             await self.test_increment_view_count()
             await self.test_publish_post()
             await self.test_publish_already_published()
 
-            # Search
-            await self.test_search_posts_by_author()
-            await self.test_search_posts_by_tag()
-
-            # Statistics
-            await self.test_statistics()
-
             # Delete (last)
             await self.test_delete_post()
             await self.test_delete_author_with_posts()
@@ -539,6 +620,45 @@ class APIValidator:
             # Print summary
             self.print_summary()
 
+    # ========== LOAD MODE ==========
+
+    async def run_load(self, vus: int = 50, iterations: int = 200):
+        """Hit the read-only endpoints from vus concurrent users.
+
+        Each user requests every LOAD_PATHS entry iterations times. Only the
+        totals are printed, not a line per request.
+        """
+        timings: list[float] = []
+        errors = 0
+
+        async def user():
+            nonlocal errors
+            for _ in range(iterations):
+                for path in LOAD_PATHS:
+                    start = time.perf_counter()
+                    try:
+                        response = await self.client.get(path)
+                        if response.status_code != 200:
+                            errors += 1
+                    except httpx.HTTPError:
+                        errors += 1
+                    timings.append(time.perf_counter() - start)
+
+        print(f"\n{BOLD}Load test: {vus} users x {iterations} iterations "
+              f"x {len(LOAD_PATHS)} endpoints{RESET}")
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(vus)))
+        elapsed = time.perf_counter() - started
+
+        p50, p95, p99 = (
+            statistics.quantiles(timings, n=100)[i] * 1000 for i in (49, 94, 98)
+        )
+        print(f"Requests: {len(timings)} in {elapsed:.2f}s "
+              f"({len(timings) / elapsed:.0f} req/s)")
+        print(f"Latency: p50 {p50:.1f} ms, p95 {p95:.1f} ms, p99 {p99:.1f} ms")
+        color = GREEN if errors == 0 else RED
+        print(f"{color}Errors: {errors}{RESET}")
+
     def print_summary(self):
         """Print test summary."""
         print(f"\n{BOLD}{'=' * 70}")
@@ -556,13 +676,27 @@ class APIValidator:
 
 async def main():
     """Run validation script."""
-    validator = APIValidator()
-
-    try:
-        await validator.run_all_tests()
-    finally:
-        await validator.close()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--load", action="store_true",
+                        help="run the load test instead of the test suite")
+    parser.add_argument("--vus", type=int, default=50,
+                        help="concurrent virtual users in load mode")
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="iterations per virtual user in load mode")
+    args = parser.parse_args()
+
+    async with APIValidator() as validator:
+        if args.load:
+            await validator.run_load(args.vus, args.iterations)
+        else:
+            await validator.run_all_tests()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; use it when installed, otherwise the stock loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import logging
 import re
+from typing import Any
 
 from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.asynchronous.database import AsyncDatabase
 
 from pygoose.utils.exceptions import NotConnected
@@ -12,14 +14,18 @@ logger = logging.getLogger(__name__)
 
 _clients: dict[str, AsyncMongoClient] = {}
 _databases: dict[str, AsyncDatabase] = {}
+# Collection handles per (alias, collection name), built once per connection
+_collections: dict[tuple[str, str], AsyncCollection] = {}
 
 
-async def connect(uri: str, *, alias: str = "default") -> AsyncDatabase:
+async def connect(uri: str, *, alias: str = "default", **client_kwargs: Any) -> AsyncDatabase:
     """Connect to a MongoDB instance and register the connection.
 
     Args:
         uri: MongoDB connection URI (must include database name).
         alias: Connection alias for multi-database setups.
+        **client_kwargs: Extra options passed to AsyncMongoClient, such as
+            maxPoolSize, minPoolSize or maxIdleTimeMS.
 
     Returns:
         The AsyncDatabase instance.
@@ -31,8 +37,9 @@ async def connect(uri: str, *, alias: str = "default") -> AsyncDatabase:
 
     try:
         db_name = _extract_db_name(uri)
-        client = AsyncMongoClient(uri)
+        client = AsyncMongoClient(uri, **client_kwargs)
         db = client[db_name]
+        _clear_collections(alias)
         _clients[alias] = client
         _databases[alias] = db
         logger.info(f"Connected to database '{db_name}' with alias '{alias}'")
@@ -50,6 +57,7 @@ async def disconnect(alias: str = "default") -> None:
     """
     client = _clients.pop(alias, None)
     _databases.pop(alias, None)
+    _clear_collections(alias)
     if client is not None:
         await client.close()
         logger.info(f"Disconnected from MongoDB (alias: '{alias}')")
@@ -75,6 +83,33 @@ def get_database(alias: str = "default") -> AsyncDatabase:
         )
 
 
+def get_collection(name: str, alias: str = "default") -> AsyncCollection:
+    """Retrieve a collection handle, creating it once per connection.
+
+    Args:
+        name: Collection name
+        alias: Connection alias
+
+    Returns:
+        AsyncCollection instance
+
+    Raises:
+        NotConnected: If no connection exists for the alias
+    """
+    try:
+        return _collections[(alias, name)]
+    except KeyError:
+        collection = get_database(alias)[name]
+        _collections[(alias, name)] = collection
+        return collection
+
+
+def _clear_collections(alias: str) -> None:
+    """Drop cached collection handles for an alias."""
+    for key in [k for k in _collections if k[0] == alias]:
+        del _collections[key]
+
+
 def get_client(alias: str = "default") -> AsyncMongoClient:
     """Retrieve a registered client or raise NotConnected.
 
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, ClassVar, Optional, Self, TYPE_CHECKING
+import types
+from typing import Any, ClassVar, Optional, Self, TYPE_CHECKING, Union, get_args, get_origin
 
 if TYPE_CHECKING:
     from pygoose.core.queryset import QuerySet
 
 from bson import ObjectId
-from pydantic import BaseModel, Field, PrivateAttr, field_serializer
+from pydantic import BaseModel, Field, PrivateAttr, SerializationInfo, field_serializer
 from pymongo.asynchronous.collection import AsyncCollection
 
-from pygoose.core.connection import get_database
+from pygoose.core.connection import get_collection
 from pygoose.fields.encrypted import decrypt_value, encrypt_value, detect_encrypted_fields
 from pygoose.utils.exceptions import DocumentNotFound
 from pygoose.fields.base import PyObjectId
@@ -22,6 +23,18 @@ from pygoose.utils.settings import SettingsResolver
 _document_registry: dict[str, type[Document]] = {}
 
 
+def _is_objectid_annotation(annotation: Any) -> bool:
+    """True for ObjectId and Ref[...] annotations, optionally wrapped in Optional."""
+    from pygoose.core.reference import Ref
+
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return False
+        annotation = args[0]
+    return annotation is ObjectId or (isinstance(annotation, type) and issubclass(annotation, Ref))
+
+
 class Document(BaseModel):
     """Base document class for MongoDB models.
 
@@ -80,13 +93,14 @@ class Document(BaseModel):
         super().__setattr__(name, value)
 
     @field_serializer("*", mode="plain")
-    def serialize_objectid_fields(self, value: Any) -> Any:
+    def serialize_objectid_fields(self, value: Any, info: SerializationInfo) -> Any:
         """Automatically serialize ObjectId fields to strings.
 
         This ensures that any raw bson.ObjectId fields are converted to strings
         during JSON serialization, making them suitable for REST APIs and FastAPI.
+        Python-mode dumps (used by _to_mongo) keep the ObjectId.
         """
-        if isinstance(value, ObjectId):
+        if isinstance(value, ObjectId) and info.mode == "json":
             return str(value)
         return value
 
@@ -111,7 +125,8 @@ class Document(BaseModel):
         if not self._dirty_fields:
             return {}
         changes = {}
-        data = self._to_mongo()
+        # Serialize (and encrypt) only the fields being written
+        data = self._to_mongo(include=self._dirty_fields)
         for field_name in self._dirty_fields:
             # Use the alias if present for mongo field name
             field_info = self.__class__.model_fields[field_name]
@@ -121,13 +136,14 @@ class Document(BaseModel):
 
     # --- Serialization ---
 
-    def _to_mongo(self) -> DocumentData:
+    def _to_mongo(self, include: set[str] | None = None) -> DocumentData:
         """Convert document to MongoDB-compatible dict.
 
         Uses mode='python' to preserve native types like ObjectId
-        (instead of serializing them to strings for JSON).
+        (instead of serializing them to strings for JSON). include limits
+        the output to the given field names.
         """
-        data = self.model_dump(by_alias=True, mode="python")
+        data = self.model_dump(by_alias=True, mode="python", include=include)
         # Remove None _id (for new documents)
         if data.get("_id") is None:
             data.pop("_id", None)
@@ -140,25 +156,45 @@ class Document(BaseModel):
         return data
 
     @classmethod
-    def _from_mongo(cls, data: DocumentData) -> Self:
-        """Create a document instance from MongoDB data."""
+    def _from_mongo(cls, data: DocumentData, partial: bool = False) -> Self:
+        """Create a document instance from MongoDB data.
+
+        With partial=True (results of a projected query) only the fields that
+        are present are validated, so fields left out by the projection don't
+        fail required-field validation. Omitted fields keep their defaults;
+        omitted required fields are unset and raise AttributeError on access.
+        """
         if cls._encrypted_fields:
             data = dict(data)  # Copy to avoid mutating cursor result
             for field_name in cls._encrypted_fields:
                 value = data.get(field_name)
                 if value is not None:
                     data[field_name] = decrypt_value(value)
-        doc = cls.model_validate(data)
+        if partial:
+            doc = cls._validate_partial(data)
+        else:
+            doc = cls.model_validate(data)
         doc._mark_loaded()
         return doc
 
+    @classmethod
+    def _validate_partial(cls, data: DocumentData) -> Self:
+        """Build an instance from a subset of fields, validating each one present."""
+        field_names = {info.alias or name: name for name, info in cls.model_fields.items()}
+        doc = cls.model_construct()
+        validator = cls.__pydantic_validator__
+        for key, value in data.items():
+            field_name = field_names.get(key)
+            if field_name is not None:
+                validator.validate_assignment(doc, field_name, value)
+        return doc
+
     # --- Collection access ---
 
     @classmethod
     def get_collection(cls) -> AsyncCollection:
         """Get the MongoDB collection for this document class."""
-        db = get_database(cls._connection_alias)
-        return db[cls._collection_name]
+        return get_collection(cls._collection_name, cls._connection_alias)
 
     # --- Indexing ---
 
@@ -286,6 +322,64 @@ class Document(BaseModel):
         merged = merge_filters(filter, **kwargs)
         return QuerySet(cls, merged)
 
+    @classmethod
+    async def migrate_string_refs(cls) -> dict[str, int]:
+        """Convert ObjectId and Ref fields stored as hex strings to ObjectIds.
+
+        Documents saved with pygoose 0.3.0 stored these fields as strings,
+        which don't match ObjectId filters or $lookup populate. Runs one
+        server-side update_many per field; safe to run more than once.
+
+        Returns:
+            Number of documents updated, per field
+        """
+        collection = cls.get_collection()
+        updated: dict[str, int] = {}
+        for name, info in cls.model_fields.items():
+            if name == "id" or not _is_objectid_annotation(info.annotation):
+                continue
+            field = info.alias or name
+            async with track_query("update_many", cls._collection_name, cls.__name__, filter={field: {"$type": "string"}}) as ctx:
+                result = await collection.update_many(
+                    {field: {"$type": "string", "$regex": "^[0-9a-fA-F]{24}$"}},
+                    [{"$set": {field: {"$toObjectId": f"${field}"}}}],
+                )
+                ctx["result_count"] = result.modified_count
+            updated[field] = result.modified_count
+        return updated
+
+    @classmethod
+    async def insert_many(cls, documents: list[Self], *, ordered: bool = True) -> list[Self]:
+        """Insert several new documents in a single round trip.
+
+        Lifecycle hooks run for each document exactly as with insert().
+
+        Args:
+            documents: New (unsaved) instances of this class
+            ordered: Stop at the first failed insert (MongoDB's ordered semantics)
+
+        Returns:
+            The same documents, with ids assigned
+        """
+        if not documents:
+            return documents
+
+        for doc in documents:
+            await run_hooks(doc, PRE_VALIDATE)
+            await run_hooks(doc, PRE_SAVE)
+        async with track_query("insert_many", cls._collection_name, cls.__name__) as ctx:
+            collection = cls.get_collection()
+            result = await collection.insert_many(
+                [doc._to_mongo() for doc in documents], ordered=ordered
+            )
+            for doc, inserted_id in zip(documents, result.inserted_ids):
+                doc.id = inserted_id
+                doc._mark_loaded()
+            ctx["result_count"] = len(result.inserted_ids)
+        for doc in documents:
+            await run_hooks(doc, POST_SAVE)
+        return documents
+
     # --- Instance-level CRUD ---
 
     async def insert(self) -> None:
@@ -105,6 +105,14 @@ class QuerySet(Generic[T]):
         projection["_id"] = 1
         return self._clone(projection=projection)
 
+    def exclude(self, *fields: str) -> QuerySet[T]:
+        """Set a projection that loads every field except the given ones.
+
+        Example: .exclude("content") for list views of large documents.
+        """
+        projection = {f: 0 for f in fields}
+        return self._clone(projection=projection)
+
     def populate(self, *fields: str) -> QuerySet[T]:
         """Mark reference fields to be populated after query execution."""
         merged = self._populate_fields + list(fields)
@@ -113,26 +121,41 @@ class QuerySet(Generic[T]):
     # --- Terminal methods ---
 
     async def all(self) -> list[T]:
-        """Execute the query and return all matching documents."""
+        """Execute the query and return all matching documents.
+
+        Top-level populate fields whose target shares this document's
+        connection are joined server-side with $lookup, so the documents and
+        their references arrive in one round trip. Dotted paths and
+        cross-connection references are resolved afterwards by PopulateEngine.
+        """
+        lookup_fields, deferred_fields = self._split_populate_fields()
         async with track_query("find", self._document_class._collection_name, self._document_class.__name__, filter=self._filter) as ctx:
-            cursor = self._build_cursor()
-            results = []
-            async for raw in cursor:
-                doc = self._document_class._from_mongo(raw)
-                results.append(doc)
+            if lookup_fields:
+                results = await self._all_with_lookup(lookup_fields)
+            else:
+                cursor = self._build_cursor()
+                partial = self._projection is not None
+                results = []
+                async for raw in cursor:
+                    doc = self._document_class._from_mongo(raw, partial=partial)
+                    results.append(doc)
             ctx["result_count"] = len(results)
 
         # Run populate if requested
-        if self._populate_fields and results:
-            from pygoose.core.reference import PopulateEngine
+        await self._populate_deferred(results, deferred_fields, lookup_fields)
+
+        return results
 
-            engine = PopulateEngine()
-            for field in self._populate_fields:
-                if "." in field:
-                    await engine.populate_nested(results, field)
-                else:
-                    await engine.populate_many(results, field)
+    async def raw(self) -> list[dict[str, Any]]:
+        """Execute the query and return the MongoDB documents as plain dicts.
 
+        Skips building Document instances, for read paths that only pass data
+        through. Encrypted fields are returned as stored (ciphertext) and
+        populate() is ignored.
+        """
+        async with track_query("find", self._document_class._collection_name, self._document_class.__name__, filter=self._filter) as ctx:
+            results = await self._build_cursor().to_list()
+            ctx["result_count"] = len(results)
         return results
 
     async def first(self) -> T | None:
@@ -141,17 +164,34 @@ class QuerySet(Generic[T]):
         results = await qs.all()
         return results[0] if results else None
 
-    async def count(self) -> int:
-        """Count matching documents."""
+    async def count(self, exact: bool = False) -> int:
+        """Count matching documents.
+
+        With no filter this reads the collection size from metadata
+        (estimated_document_count) instead of scanning. That count can drift
+        after an unclean shutdown and does not run inside transactions;
+        pass exact=True to count the documents instead.
+        """
         async with track_query("count", self._document_class._collection_name, self._document_class.__name__, filter=self._filter) as ctx:
             collection = self._document_class.get_collection()
-            result = await collection.count_documents(self._filter)
+            if self._filter or exact:
+                result = await collection.count_documents(self._filter)
+            else:
+                result = await collection.estimated_document_count()
             ctx["result_count"] = result
         return result
 
     async def exists(self) -> bool:
-        """Check if any matching documents exist."""
-        return await self.count() > 0
+        """Check if any matching documents exist.
+
+        Stops at the first match and reads only its _id, rather than
+        counting every match.
+        """
+        async with track_query("find_one", self._document_class._collection_name, self._document_class.__name__, filter=self._filter) as ctx:
+            collection = self._document_class.get_collection()
+            result = await collection.find_one(self._filter, {"_id": 1})
+            ctx["result_count"] = 0 if result is None else 1
+        return result is not None
 
     async def distinct(self, field: str) -> list[Any]:
         """Return distinct values for a field."""
@@ -203,16 +243,37 @@ class QuerySet(Generic[T]):
     # --- Pagination ---
 
     async def paginate(self, page: int = 1, size: int = 20) -> Page[T]:
-        """Offset-based pagination. Returns a Page with items and metadata."""
+        """Offset-based pagination. Returns a Page with items and metadata.
+
+        The page and the total count come from a single $facet aggregation,
+        so one round trip serves both. Sorting happens before the $facet so it
+        can still use an index; the count walks every matching document.
+        """
         if page < 1:
             raise ValueError("page must be >= 1")
         if size < 1:
             raise ValueError("size must be >= 1")
 
-        total = await self.count()
-        total_pages = math.ceil(total / size) if total > 0 else 0
-        items = await self.skip((page - 1) * size).limit(size).all()
+        # Sort is applied before $facet, where it can use an index
+        qs = self._clone(sort=[]).skip((page - 1) * size).limit(size)
+        lookup_fields, deferred_fields = qs._split_populate_fields()
+        pipeline: list[dict[str, Any]] = [{"$match": self._filter}]
+        if self._sort:
+            pipeline.append({"$sort": dict(self._sort)})
+        pipeline.append({"$facet": {
+            "items": qs._pipeline_stages(lookup_fields),
+            "total": [{"$count": "n"}],
+        }})
+        async with track_query("paginate", self._document_class._collection_name, self._document_class.__name__, filter=self._filter) as ctx:
+            cursor = await self._document_class.get_collection().aggregate(pipeline)
+            facets = await cursor.to_list()
+            result = facets[0] if facets else {"items": [], "total": []}
+            total = result["total"][0]["n"] if result["total"] else 0
+            items = qs._hydrate(result["items"], lookup_fields)
+            ctx["result_count"] = len(items)
+        await qs._populate_deferred(items, deferred_fields, lookup_fields)
 
+        total_pages = math.ceil(total / size) if total > 0 else 0
         return Page(
             items=items,
             page=page,
@@ -223,18 +284,26 @@ class QuerySet(Generic[T]):
             total_pages=total_pages,
         )
 
-    async def cursor_paginate(self, size: int = 20, after: str | None = None) -> CursorPage[T]:
-        """Cursor-based pagination using _id. Always sorts by _id ascending."""
+    async def cursor_paginate(
+        self, size: int = 20, after: str | ObjectId | None = None, descending: bool = False
+    ) -> CursorPage[T]:
+        """Cursor-based pagination using _id.
+
+        Sorts by _id ascending, or newest first when descending=True.
+        after is a next_cursor string or an already parsed ObjectId.
+        """
         if size < 1:
             raise ValueError("size must be >= 1")
 
         filter_spec = self._filter.copy()
         if after is not None:
-            filter_spec["_id"] = {"$gt": ObjectId(after)}
+            if not isinstance(after, ObjectId):
+                after = ObjectId(after)
+            filter_spec["_id"] = {"$lt" if descending else "$gt": after}
 
         qs = self._clone(filter=filter_spec)
         # Fetch size+1 to detect if there's a next page
-        items = await qs.sort("_id").limit(size + 1).all()
+        items = await qs.sort("-_id" if descending else "_id").limit(size + 1).all()
 
         has_next = len(items) > size
         if has_next:
@@ -253,11 +322,120 @@ class QuerySet(Generic[T]):
 
     async def __aiter__(self):
         cursor = self._build_cursor()
+        partial = self._projection is not None
         async for raw in cursor:
-            yield self._document_class._from_mongo(raw)
+            yield self._document_class._from_mongo(raw, partial=partial)
 
     # --- Internal ---
 
+    def _split_populate_fields(self) -> tuple[dict[str, type], list[str]]:
+        """Split populate fields into $lookup-able ones and the rest.
+
+        Returns a mapping of field name -> target class for fields that can be
+        joined with $lookup, and the remaining fields in their original order.
+        """
+        from pygoose.core.document import Document
+        from pygoose.core.reference import _resolve_target_class
+
+        lookup: dict[str, type] = {}
+        deferred: list[str] = []
+        for field in self._populate_fields:
+            if "." in field or field in lookup or field not in self._document_class.model_fields:
+                deferred.append(field)
+                continue
+            try:
+                target = _resolve_target_class(self._document_class, field)
+            except ValueError:
+                # Not a resolvable Ref; leave the error to PopulateEngine
+                deferred.append(field)
+                continue
+            # Optional[Ref[X]] and list[Ref[X]] resolve to the Ref wrapper, not
+            # a Document; PopulateEngine handles those
+            if not (isinstance(target, type) and issubclass(target, Document)):
+                deferred.append(field)
+            elif target._connection_alias == self._document_class._connection_alias:
+                lookup[field] = target
+            else:
+                deferred.append(field)
+        return lookup, deferred
+
+    def _pipeline_stages(self, lookup_fields: dict[str, type]) -> list[dict[str, Any]]:
+        """Aggregation stages equivalent to the find, plus one $lookup per field.
+
+        Does not include the $match stage.
+        """
+        stages: list[dict[str, Any]] = []
+        if self._sort:
+            stages.append({"$sort": dict(self._sort)})
+        if self._skip_count:
+            stages.append({"$skip": self._skip_count})
+        if self._limit_count:
+            stages.append({"$limit": self._limit_count})
+        if self._projection:
+            stages.append({"$project": self._projection})
+        for field, target in lookup_fields.items():
+            stages.append({
+                "$lookup": {
+                    "from": target._collection_name,
+                    "localField": self._document_class.model_fields[field].alias or field,
+                    "foreignField": "_id",
+                    "as": f"__populate_{field}",
+                }
+            })
+        return stages
+
+    def _hydrate(self, raw_docs: list[dict[str, Any]], lookup_fields: dict[str, type]) -> list[T]:
+        """Build documents from aggregation output, attaching $lookup results."""
+        partial = self._projection is not None
+        # One instance per referenced document, as PopulateEngine does
+        resolved: dict[tuple[str, ObjectId], Any] = {}
+        results = []
+        for raw in raw_docs:
+            joined = {field: raw.pop(f"__populate_{field}", None) for field in lookup_fields}
+            doc = self._document_class._from_mongo(raw, partial=partial)
+            for field, matches in joined.items():
+                if not matches:
+                    continue
+                target = lookup_fields[field]
+                key = (target._collection_name, matches[0]["_id"])
+                if key not in resolved:
+                    resolved[key] = target._from_mongo(matches[0])
+                object.__setattr__(doc, field, resolved[key])
+            results.append(doc)
+        return results
+
+    async def _all_with_lookup(self, lookup_fields: dict[str, type]) -> list[T]:
+        """Run the query as an aggregation that joins lookup_fields with $lookup."""
+        pipeline = [{"$match": self._filter}, *self._pipeline_stages(lookup_fields)]
+        cursor = await self._document_class.get_collection().aggregate(pipeline)
+        return self._hydrate(await cursor.to_list(), lookup_fields)
+
+    async def _populate_deferred(
+        self, results: list[T], fields: list[str], lookup_fields: dict[str, type] | None = None
+    ) -> None:
+        """Resolve populate fields that were not joined with $lookup.
+
+        Joined fields that still hold an ObjectId found no match, most often
+        because the reference was stored as a string (see
+        Document.migrate_string_refs()); those are retried with PopulateEngine,
+        which looks them up by ObjectId.
+        """
+        unmatched = [
+            field for field in lookup_fields or ()
+            if any(isinstance(getattr(doc, field, None), ObjectId) for doc in results)
+        ]
+        fields = unmatched + fields
+        if not fields or not results:
+            return
+        from pygoose.core.reference import PopulateEngine
+
+        engine = PopulateEngine()
+        for field in fields:
+            if "." in field:
+                await engine.populate_nested(results, field)
+            else:
+                await engine.populate_many(results, field)
+
     def _build_cursor(self):
         """Compose a pymongo cursor from stored query parameters."""
         collection = self._document_class.get_collection()
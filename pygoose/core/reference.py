@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar, get_args
+import types
+from typing import Any, Generic, TypeVar, Union, get_args, get_origin
 
 from bson import ObjectId
 from pydantic import GetCoreSchemaHandler
@@ -107,6 +108,12 @@ def _resolve_target_class(doc_class: type, field_name: str) -> type:
     # Get the field annotation
     annotation = doc_class.model_fields[field_name].annotation
 
+    # Optional[Ref[T]] / Ref[T] | None: look through to the Ref
+    if get_origin(annotation) in (Union, types.UnionType):
+        refs = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(refs) == 1:
+            annotation = refs[0]
+
     # Extract target from Ref[T]
     target = getattr(annotation, "__ref_target__", None)
     if target is None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from bson import ObjectId
+from bson.errors import InvalidId
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
@@ -36,7 +37,9 @@ class PyObjectId(ObjectId):
         if isinstance(value, ObjectId):
             return value
         if isinstance(value, str):
-            if not ObjectId.is_valid(value):
-                raise ValueError(f"Invalid ObjectId: {value}")
-            return ObjectId(value)
+            # Parse once; ObjectId.is_valid() would parse the string as well
+            try:
+                return ObjectId(value)
+            except InvalidId:
+                raise ValueError(f"Invalid ObjectId: {value}") from None
         raise ValueError(f"Cannot convert {type(value)} to ObjectId")
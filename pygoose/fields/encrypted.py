@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import base64
 import logging
+import os
 from typing import Any
 
 from pygoose.utils.exceptions import PygooseError
@@ -16,12 +18,48 @@ class _EncryptedMarker:
     """Sentinel metadata marker for Encrypted[str] fields."""
 
 
+_TOKEN_PREFIX = "v2:"
+_NONCE_SIZE = 12
+
+
+class _Cipher:
+    """AES-256-GCM cipher built once per key.
+
+    New values are written as ``v2:`` + base64(nonce + ciphertext). Values
+    without the prefix are legacy Fernet tokens and are still decrypted.
+    """
+
+    def __init__(self, key: bytes) -> None:
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        # Fernet validates the key format and reads pre-AESGCM values
+        self._fernet = Fernet(key)
+        self._aesgcm = AESGCM(base64.urlsafe_b64decode(key))
+
+    def encrypt(self, plaintext: str) -> str:
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = self._aesgcm.encrypt(nonce, plaintext.encode(), None)
+        return _TOKEN_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode()
+
+    def decrypt(self, token: str) -> str:
+        if not token.startswith(_TOKEN_PREFIX):
+            return self._fernet.decrypt(token.encode()).decode()
+        raw = base64.urlsafe_b64decode(token[len(_TOKEN_PREFIX):])
+        nonce, ciphertext = raw[:_NONCE_SIZE], raw[_NONCE_SIZE:]
+        return self._aesgcm.decrypt(nonce, ciphertext, None).decode()
+
+
 class EncryptionManager:
-    """Manages encryption keys and operations with thread-safe state."""
+    """Manages encryption keys and operations with thread-safe state.
+
+    The cipher is constructed once in set_key() and reused for every
+    encrypt/decrypt call.
+    """
 
     def __init__(self) -> None:
         self._key: bytes | None = None
-        self._fernet: Any = None
+        self._cipher: _Cipher | None = None
 
     def set_key(self, key: str | bytes) -> None:
         """Set the encryption key with type safety.
@@ -32,13 +70,11 @@ class EncryptionManager:
         Raises:
             ValueError: If key format is invalid
         """
-        from cryptography.fernet import Fernet
-
         try:
             if isinstance(key, str):
                 key = key.encode()
+            self._cipher = _Cipher(key)
             self._key = key
-            self._fernet = Fernet(key)
             logger.debug("Encryption key set successfully")
         except Exception as e:
             logger.error(f"Failed to set encryption key: {e}")
@@ -71,12 +107,12 @@ class EncryptionManager:
         Raises:
             EncryptionKeyNotSet: If no key has been configured
         """
-        if self._fernet is None:
+        if self._cipher is None:
             raise EncryptionKeyNotSet(
                 "No encryption key set. Call set_encryption_key() first."
             )
         try:
-            return self._fernet.encrypt(plaintext.encode()).decode()
+            return self._cipher.encrypt(plaintext)
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             raise
@@ -93,12 +129,12 @@ class EncryptionManager:
         Raises:
             EncryptionKeyNotSet: If no key has been configured
         """
-        if self._fernet is None:
+        if self._cipher is None:
             raise EncryptionKeyNotSet(
                 "No encryption key set. Call set_encryption_key() first."
             )
         try:
-            return self._fernet.decrypt(ciphertext.encode()).decode()
+            return self._cipher.decrypt(ciphertext)
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             raise
@@ -106,7 +142,7 @@ class EncryptionManager:
     def reset(self) -> None:
         """Reset encryption state (for testing)."""
         self._key = None
-        self._fernet = None
+        self._cipher = None
         logger.debug("Encryption state reset")
 
 
@@ -116,7 +152,7 @@ encryption = EncryptionManager()
 
 # Convenience functions (direct delegation to manager)
 def generate_encryption_key() -> str:
-    """Generate a new Fernet-compatible encryption key.
+    """Generate a new 32-byte encryption key (Fernet-compatible encoding).
 
     Returns:
         New encryption key as base64-encoded string
@@ -196,16 +232,14 @@ async def rotate_encryption_key(
     Raises:
         ValueError: If keys are invalid or encryption fails
     """
-    from cryptography.fernet import Fernet
-
     if isinstance(old_key, str):
         old_key = old_key.encode()
     if isinstance(new_key, str):
         new_key = new_key.encode()
 
     try:
-        old_fernet = Fernet(old_key)
-        new_fernet = Fernet(new_key)
+        old_cipher = _Cipher(old_key)
+        new_cipher = _Cipher(new_key)
     except Exception as e:
         logger.error(f"Invalid encryption keys: {e}")
         raise ValueError(f"Invalid encryption keys: {e}") from e
@@ -229,9 +263,9 @@ async def rotate_encryption_key(
                     value = raw_doc.get(field_name)
                     if value is not None:
                         # Decrypt with old key
-                        plaintext = old_fernet.decrypt(value.encode()).decode()
+                        plaintext = old_cipher.decrypt(value)
                         # Encrypt with new key
-                        new_ciphertext = new_fernet.encrypt(plaintext.encode()).decode()
+                        new_ciphertext = new_cipher.encrypt(plaintext)
                         update[field_name] = new_ciphertext
 
                 if update:
@@ -11,13 +11,14 @@ from pymongo import ASCENDING
 class IndexSpec:
     """Specification for a MongoDB index."""
 
-    fields: str | list[tuple[str, int]]
+    fields: str | list[tuple[str, int | str]]
     unique: bool = False
     sparse: bool = False
     name: str | None = None
     expire_after_seconds: int | None = None
+    weights: dict[str, int] | None = None  # Text indexes: relative field weights
 
-    def to_pymongo(self) -> tuple[list[tuple[str, int]], dict[str, Any]]:
+    def to_pymongo(self) -> tuple[list[tuple[str, int | str]], dict[str, Any]]:
         """Convert to pymongo create_index arguments (keys, kwargs)."""
         if isinstance(self.fields, str):
             keys = [(self.fields, ASCENDING)]
@@ -33,6 +34,8 @@ class IndexSpec:
             kwargs["name"] = self.name
         if self.expire_after_seconds is not None:
             kwargs["expireAfterSeconds"] = self.expire_after_seconds
+        if self.weights:
+            kwargs["weights"] = self.weights
 
         return keys, kwargs
 
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 from contextlib import asynccontextmanager
 from typing import Any, Generic, Optional, TypeVar
 
 from bson import ObjectId
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, create_model
+from pydantic_core import PydanticSerializationError, to_json
 
 from pygoose.core.connection import connect, disconnect
 from pygoose.utils.exceptions import DocumentNotFound, PygooseError
@@ -23,13 +23,22 @@ class ObjectIDJSONResponse(JSONResponse):
     """
 
     def render(self, content: Any) -> bytes:
-        """Render content to JSON, handling ObjectId serialization."""
-        def default_handler(obj: Any) -> Any:
-            if isinstance(obj, ObjectId):
-                return str(obj)
-            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-
-        return json.dumps(content, default=default_handler, separators=(",", ":")).encode("utf-8")
+        """Render content to JSON, handling ObjectId serialization.
+
+        Encoding is done by pydantic-core, which handles datetimes, models and
+        other common types natively; ObjectId goes through the fallback.
+        """
+        try:
+            return to_json(content, fallback=_objectid_fallback)
+        except PydanticSerializationError as e:
+            # Keep json.dumps' error type for unsupported values
+            raise TypeError(str(e)) from e
+
+
+def _objectid_fallback(obj: Any) -> Any:
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def init_app(app: Any, uri: str, alias: str = "default") -> Any:
@@ -50,13 +50,13 @@ class AuditMixin:
         db = get_database(cls._connection_alias)
         return db["_audit_log"]
 
-    async def _log_audit(
+    def _audit_entry(
         self,
         operation: str,
         document_id: Any,
         changes: dict | None = None,
         after: dict | None = None,
-    ) -> None:
+    ) -> dict[str, Any]:
         ctx = get_audit_context()
         entry = {
             "collection": self._collection_name,
@@ -72,6 +72,16 @@ class AuditMixin:
             entry["changes"] = changes
         if after is not None:
             entry["after"] = after
+        return entry
+
+    async def _log_audit(
+        self,
+        operation: str,
+        document_id: Any,
+        changes: dict | None = None,
+        after: dict | None = None,
+    ) -> None:
+        entry = self._audit_entry(operation, document_id, changes=changes, after=after)
         audit_col = self.__class__._get_audit_collection()
         await audit_col.insert_one(entry)
 
@@ -80,6 +90,17 @@ class AuditMixin:
         after = self._to_mongo()
         await self._log_audit("insert", self.id, after=after)
 
+    @classmethod
+    async def insert_many(cls, documents: list[Any], *, ordered: bool = True) -> list[Any]:
+        documents = await super().insert_many(documents, ordered=ordered)
+        if documents:
+            entries = [
+                doc._audit_entry("insert", doc.id, after=doc._to_mongo())
+                for doc in documents
+            ]
+            await cls._get_audit_collection().insert_many(entries)
+        return documents
+
     async def save(self) -> None:
         if self._is_new:
             await self.insert()
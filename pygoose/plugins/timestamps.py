@@ -21,6 +21,14 @@ class TimestampsMixin:
         object.__setattr__(self, "updated_at", now)
         await super().insert()
 
+    @classmethod
+    async def insert_many(cls, documents: list[Any], *, ordered: bool = True) -> list[Any]:
+        now = datetime.now(timezone.utc)
+        for doc in documents:
+            object.__setattr__(doc, "created_at", now)
+            object.__setattr__(doc, "updated_at", now)
+        return await super().insert_many(documents, ordered=ordered)
+
     async def save(self) -> None:
         if not self._is_new and self.is_dirty:
             now = datetime.now(timezone.utc)
@@ -1,7 +1,7 @@
 import pytest
 
 from pygoose import connect, disconnect, get_database
-from pygoose.core.connection import get_client
+from pygoose.core.connection import get_client, get_collection
 from pygoose.utils.exceptions import NotConnected
 
 
@@ -33,6 +33,27 @@ class TestConnect:
         assert get_database("default").name == "pygoose_test"
         await disconnect("secondary")
 
+    async def test_client_options_passed_through(self, mongo_connection):
+        await connect(
+            "mongodb://localhost:27017/pygoose_test_alt",
+            alias="pooled",
+            maxPoolSize=7,
+            minPoolSize=2,
+        )
+        pool_options = get_client("pooled").options.pool_options
+        assert pool_options.max_pool_size == 7
+        assert pool_options.min_pool_size == 2
+        await disconnect("pooled")
+
+    async def test_collection_handle_reused(self, mongo_connection):
+        assert get_collection("things") is get_collection("things")
+
+    async def test_reconnect_drops_collection_handles(self, mongo_connection):
+        before = get_collection("things")
+        await disconnect()
+        await connect("mongodb://localhost:27017/pygoose_test")
+        assert get_collection("things") is not before
+
     async def test_disconnect_removes_connection(self, mongo_connection):
         await disconnect()
         with pytest.raises(NotConnected):
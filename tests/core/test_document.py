@@ -65,6 +65,28 @@ class TestFindOne:
         assert found.email == "eve@example.com"
 
 
+class TestInsertMany:
+    async def test_insert_many_assigns_ids(self, mongo_connection):
+        users = [User(name=f"Bulk {i}", email=f"bulk{i}@example.com") for i in range(3)]
+        inserted = await User.insert_many(users)
+        assert inserted is users
+        assert all(isinstance(u.id, ObjectId) for u in users)
+        assert len({u.id for u in users}) == 3
+        assert await User.find().count() == 3
+
+    async def test_insert_many_marks_loaded(self, mongo_connection):
+        users = await User.insert_many([User(name="Gina", email="gina@example.com")])
+        user = users[0]
+        user.name = "Gina B."
+        assert user.dirty_fields == {"name"}
+        await user.save()
+        fetched = await User.get(user.id)
+        assert fetched.name == "Gina B."
+
+    async def test_insert_many_empty(self, mongo_connection):
+        assert await User.insert_many([]) == []
+
+
 class TestSave:
     async def test_save_new_document(self, mongo_connection):
         user = User(name="Frank", email="frank@example.com")
@@ -1,4 +1,5 @@
 import pytest
+from pydantic import BaseModel
 
 from pygoose import Document
 from pygoose.utils.exceptions import PygooseError
@@ -10,6 +11,16 @@ class Article(Document):
     views: int = 0
 
 
+class Venue(BaseModel):
+    city: str
+
+
+class Event(Document):
+    name: str
+    venue: Venue
+    attendees: int = 0
+
+
 class TestQuerySet:
     async def test_find_returns_queryset(self, mongo_connection):
         from pygoose.core.queryset import QuerySet
@@ -40,6 +51,19 @@ class TestQuerySet:
         count = await Article.find(category="tech").count()
         assert count == 2
 
+    async def test_count_without_filter(self, mongo_connection):
+        await Article.create(title="A1", category="tech")
+        await Article.create(title="A2", category="science")
+        assert await Article.find().count() == 2
+
+    async def test_count_exact_without_filter(self, mongo_connection):
+        await Article.create(title="A1", category="tech")
+        await Article.create(title="A2", category="science")
+        assert await Article.find().count(exact=True) == 2
+
+    async def test_count_empty_collection(self, mongo_connection):
+        assert await Article.find().count() == 0
+
     async def test_exists_true(self, mongo_connection):
         await Article.create(title="Exists", category="tech")
         assert await Article.find(category="tech").exists()
@@ -148,3 +172,41 @@ class TestQuerySet:
         assert len(results) == 1
         assert results[0].title == "Projected"
         assert results[0].category == "tech"
+
+    async def test_select_skips_unselected_required_fields(self, mongo_connection):
+        await Article.create(title="Only title", category="tech", views=3)
+        results = await Article.find().select("title").all()
+        assert len(results) == 1
+        assert results[0].title == "Only title"
+        assert "category" not in results[0].model_fields_set
+
+    async def test_exclude_projection(self, mongo_connection):
+        await Article.create(title="Excluded", category="tech", views=42)
+        results = await Article.find().exclude("category").all()
+        assert len(results) == 1
+        assert results[0].title == "Excluded"
+        assert results[0].views == 42
+        assert "category" not in results[0].model_fields_set
+
+    async def test_raw_returns_dicts(self, mongo_connection):
+        article = await Article.create(title="Raw", category="tech", views=7)
+        results = await Article.find().select("title").raw()
+        assert results == [{"_id": article.id, "title": "Raw"}]
+
+    async def test_projection_validates_embedded_models(self, mongo_connection):
+        await Event.create(name="Launch", venue=Venue(city="Berlin"), attendees=5)
+        results = await Event.find().select("venue").all()
+        assert isinstance(results[0].venue, Venue)
+        assert results[0].venue.city == "Berlin"
+
+        results = await Event.find().exclude("name").all()
+        assert results[0].venue.city == "Berlin"
+        assert results[0].attendees == 5
+
+    async def test_projection_omitted_fields(self, mongo_connection):
+        await Event.create(name="Meetup", venue=Venue(city="Paris"), attendees=9)
+        result = (await Event.find().select("name").all())[0]
+        # Defaults fill in, required fields stay unset
+        assert result.attendees == 0
+        with pytest.raises(AttributeError):
+            result.venue
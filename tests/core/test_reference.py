@@ -1,3 +1,5 @@
+from typing import Optional
+
 from bson import ObjectId
 
 from pygoose import Document, Ref
@@ -17,6 +19,13 @@ class Post(Document):
     author: Ref["Author"] = None
 
 
+class Project(Document):
+    name: str
+    lead: Optional[Ref["Author"]] = None
+    reviewer: Ref["Author"] | None = None
+    contributors: list[Ref["Author"]] = []
+
+
 class TestRefType:
     async def test_ref_stores_objectid_on_insert(self, mongo_connection):
         company = await Company.create(name="Acme")
@@ -97,6 +106,27 @@ class TestPopulateBatch:
         assert companies == {"Acme", "Beta"}
 
 
+    async def test_populate_shares_instance_per_reference(self, mongo_connection):
+        company = await Company.create(name="Acme")
+        await Author.create(name="Alice", company=company.id)
+        await Author.create(name="Bob", company=company.id)
+
+        authors = await Author.find().populate("company").all()
+        assert authors[0].company is authors[1].company
+        assert not authors[0].is_dirty
+
+    async def test_populate_respects_sort_and_limit(self, mongo_connection):
+        company = await Company.create(name="Acme")
+        await Author.create(name="Alice", company=company.id)
+        await Author.create(name="Bob", company=company.id)
+        await Author.create(name="Carol")
+
+        authors = await Author.find().sort("-name").limit(2).populate("company").all()
+        assert [a.name for a in authors] == ["Carol", "Bob"]
+        assert authors[0].company is None
+        assert authors[1].company.name == "Acme"
+
+
 class TestPopulateNested:
     async def test_nested_dot_notation(self, mongo_connection):
         company = await Company.create(name="Acme")
@@ -131,3 +161,43 @@ class TestPopulateNone:
         # company is None — populate should not crash
         await fetched.populate("company")
         assert fetched.company is None
+
+
+class TestPopulateOptionalAndList:
+    async def test_populate_optional_ref(self, mongo_connection):
+        author = await Author.create(name="Alice")
+        await Project.create(name="Docs", lead=author.id, reviewer=author.id)
+        await Project.create(name="Empty")
+
+        projects = await Project.find().sort("name").populate("lead", "reviewer").all()
+        assert projects[0].lead.name == "Alice"
+        assert projects[0].reviewer is projects[0].lead
+        assert projects[1].lead is None
+        assert projects[1].reviewer is None
+
+    async def test_populate_list_ref_is_left_unresolved(self, mongo_connection):
+        author = await Author.create(name="Alice")
+        await Project.create(name="Docs", contributors=[author.id])
+
+        projects = await Project.find().populate("contributors").all()
+        assert projects[0].contributors == [author.id]
+
+
+class TestStringRefs:
+    async def test_populate_falls_back_for_string_refs(self, mongo_connection):
+        author = await Author.create(name="Alice")
+        # As written by 0.3.0, which stored references as hex strings
+        await Post.get_collection().insert_one({"title": "Old", "author": str(author.id)})
+
+        posts = await Post.find().populate("author").all()
+        assert posts[0].author.name == "Alice"
+
+    async def test_migrate_string_refs(self, mongo_connection):
+        author = await Author.create(name="Alice")
+        await Post.get_collection().insert_one({"title": "Old", "author": str(author.id)})
+        await Post.create(title="New", author=author.id)
+
+        assert await Post.migrate_string_refs() == {"author": 1}
+        raw = await Post.get_collection().find_one({"title": "Old"})
+        assert raw["author"] == author.id
+        assert await Post.migrate_string_refs() == {"author": 0}
@@ -51,6 +51,23 @@ async def test_encrypt_decrypt_roundtrip():
     assert decrypt_value(ct) == "secret123"
 
 
+async def test_encrypt_uses_fresh_nonce():
+    encryption.set_key(generate_encryption_key())
+    a = encrypt_value("secret123")
+    b = encrypt_value("secret123")
+    assert a.startswith("v2:")
+    assert a != b
+
+
+async def test_decrypt_legacy_fernet_token():
+    from cryptography.fernet import Fernet
+
+    key = generate_encryption_key()
+    encryption.set_key(key)
+    legacy = Fernet(key.encode()).encrypt(b"secret123").decode()
+    assert decrypt_value(legacy) == "secret123"
+
+
 async def test_encrypted_field_stored_as_ciphertext():
     encryption.set_key(generate_encryption_key())
     doc = await SecretDoc.create(name="Alice", ssn="123-45-6789")
@@ -1,5 +1,5 @@
 import pytest
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, TEXT
 from pymongo.errors import DuplicateKeyError
 
 from pygoose import Document
@@ -34,6 +34,17 @@ class CompoundDoc(Document):
         ]
 
 
+class Article(Document):
+    title: str
+    body: str
+
+    class Settings:
+        collection = "text_articles"
+        indexes = [
+            IndexSpec(fields=[("title", TEXT), ("body", TEXT)], weights={"title": 10, "body": 1}),
+        ]
+
+
 class PlainIndexed(Document):
     category: str = Indexed()
     name: str
@@ -93,6 +104,17 @@ class TestClassLevelIndex:
         with pytest.raises(DuplicateKeyError):
             await CompoundDoc.create(first_name="Alice", last_name="Smith")
 
+    async def test_text_index_with_weights(self, mongo_connection):
+        await Article.ensure_indexes()
+        indexes = await Article.get_collection().index_information()
+        text_index = [v for k, v in indexes.items() if k != "_id_"][0]
+        assert text_index["weights"] == {"title": 10, "body": 1}
+
+        await Article.create(title="Async MongoDB", body="An ODM for Python")
+        await Article.create(title="Cooking", body="Pasta recipes")
+        results = await Article.find({"$text": {"$search": "mongodb"}}).all()
+        assert [a.title for a in results] == ["Async MongoDB"]
+
 
 class TestExplain:
     async def test_explain_returns_plan(self, mongo_connection):
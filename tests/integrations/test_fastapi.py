@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 
 import pytest
+from bson import ObjectId
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 
 from pygoose import Document
 from pygoose.utils.exceptions import DocumentNotFound, PygooseError
 from pygoose.integrations.fastapi import (
+    ObjectIDJSONResponse,
     PaginatedResponse,
     PaginationParams,
     create_schema,
@@ -107,6 +110,17 @@ def test_exception_handler_500():
     assert "Something went wrong" in resp.json()["detail"]
 
 
+def test_objectid_json_response_renders_objectid_and_datetime():
+    oid = ObjectId()
+    resp = ObjectIDJSONResponse({"id": oid, "created": datetime(2024, 1, 2, 3, 4, 5)})
+    assert resp.body == f'{{"id":"{oid}","created":"2024-01-02T03:04:05"}}'.encode()
+
+
+def test_objectid_json_response_rejects_unknown_types():
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        ObjectIDJSONResponse({"value": object()})
+
+
 async def test_init_app_connects():
     app = FastAPI()
     init_app(app, "mongodb://localhost:27017/pygoose_test_fastapi")
@@ -41,6 +41,18 @@ async def test_insert_creates_audit_entry():
     assert "after" in entry
 
 
+async def test_insert_many_creates_audit_entries():
+    docs = await AuditedUser.insert_many([
+        AuditedUser(name="Alice", email="alice@example.com"),
+        AuditedUser(name="Bob", email="bob@example.com"),
+    ])
+
+    entries = await _get_audit_entries()
+    assert len(entries) == 2
+    assert {e["document_id"] for e in entries} == {d.id for d in docs}
+    assert all(e["operation"] == "insert" for e in entries)
+
+
 async def test_save_update_creates_audit_entry():
     doc = await AuditedUser.create(name="Alice", email="alice@example.com")
     doc.name = "Bob"
@@ -35,6 +35,16 @@ class TestTimestamps:
         await user.update(name="Charlie Updated")
         assert user.updated_at > original_updated
 
+    async def test_insert_many_sets_timestamps(self, mongo_connection):
+        users = await TimestampedUser.insert_many(
+            [TimestampedUser(name="Eve"), TimestampedUser(name="Frank")]
+        )
+        for user in users:
+            assert user.created_at is not None
+            assert user.updated_at == user.created_at
+            fetched = await TimestampedUser.get(user.id)
+            assert fetched.created_at is not None
+
     async def test_timestamps_persisted_in_db(self, mongo_connection):
         user = await TimestampedUser.create(name="Diana")
         fetched = await TimestampedUser.get(user.id)
@@ -60,6 +60,12 @@ class TestOffsetPagination:
         with pytest.raises(ValueError, match="size must be >= 1"):
             await Item.find().paginate(size=0)
 
+    async def test_sorted_page_with_projection(self, mongo_connection):
+        await _seed_items(5)
+        page = await Item.find().sort("-name").select("name").paginate(page=2, size=2)
+        assert [i.name for i in page.items] == ["item_002", "item_001"]
+        assert page.total == 5
+
     async def test_single_page(self, mongo_connection):
         await _seed_items(5)
         page = await Item.find().paginate(page=1, size=10)
@@ -105,3 +111,15 @@ class TestCursorPagination:
         page = await Item.find(category="A").cursor_paginate(size=5)
         assert len(page.items) == 5
         assert page.has_next is True
+
+    async def test_descending_pages(self, mongo_connection):
+        items = await _seed_items(15)
+        page1 = await Item.find().cursor_paginate(size=10, descending=True)
+        assert [i.id for i in page1.items] == [i.id for i in reversed(items)][:10]
+        assert page1.has_next is True
+
+        page2 = await Item.find().cursor_paginate(
+            size=10, after=page1.next_cursor, descending=True
+        )
+        assert [i.id for i in page2.items] == [i.id for i in reversed(items)][10:]
+        assert page2.has_next is False